@@ -41,6 +41,9 @@ hiddenimports += collect_submodules("reportlab")
 hiddenimports += collect_submodules("PIL")
 hiddenimports += ["src.utils.pdf_report_generator"]
 
+# ijson picks its parser backend (yajl2_c, python, ...) at runtime
+hiddenimports += collect_submodules("ijson")
+
 # Some packages require data files at runtime (templates, metadata)
 datas += collect_data_files("jinja2")
 datas += collect_data_files("flask")
@@ -12,6 +12,14 @@ from loguru import logger
 from .core.extractor import EngineeringCriteriaExtractor
 
 
+def positive_int(value: str) -> int:
+    """Argument type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main CLI function."""
     parser = argparse.ArgumentParser(
@@ -46,6 +54,13 @@ def main():
         help="Document AI processor location (default: us)"
     )
     
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=positive_int,
+        default=None,
+        help="Number of PDF files processed at once when the input is a directory (default: up to 16)"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -108,7 +123,7 @@ def main():
         elif input_path.is_dir():
             # Process directory
             logger.info(f"Processing directory: {input_path}")
-            results = extractor.extract_from_directory(str(input_path), str(output_path))
+            results = extractor.extract_from_directory(str(input_path), str(output_path), max_workers=args.concurrency)
             
             successful = sum(1 for r in results.values() if r.status == "completed")
             failed = len(results) - successful
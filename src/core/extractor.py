@@ -5,8 +5,10 @@ Main engineering criteria extractor using Google Cloud Document AI.
 import os
 import json
 import uuid
+import tempfile
 from typing import Optional, Dict, Any
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 
 from ..processors.document_ai_processor import DocumentAIProcessor
@@ -86,17 +88,25 @@ class EngineeringCriteriaExtractor:
                 error_message=str(e)
             )
     
-    def extract_from_directory(self, input_dir: str, output_dir: str) -> Dict[str, ExtractionResult]:
+    def extract_from_directory(self, input_dir: str, output_dir: str,
+                               max_workers: Optional[int] = None) -> Dict[str, ExtractionResult]:
         """
         Extract engineering criteria from all PDF files in a directory.
         
+        Files are processed concurrently on a thread pool; each extraction mostly waits
+        on Document AI, so threads overlap those requests.
+        
         Args:
             input_dir: Directory containing PDF files
             output_dir: Directory to save results
+            max_workers: Maximum number of files processed at once, at least 1 (default: up to 16)
             
         Returns:
             Dictionary mapping filenames to extraction results
         """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        
         results = {}
         
         # Create output directory if it doesn't exist
@@ -111,26 +121,44 @@ class EngineeringCriteriaExtractor:
         
         logger.info(f"Found {len(pdf_files)} PDF files to process")
         
-        for pdf_file in pdf_files:
-            try:
-                result = self.extract_from_file(str(pdf_file), output_dir)
-                results[pdf_file.name] = result
-                
-                if result.status == ProcessingStatus.COMPLETED:
-                    logger.info(f"Successfully processed: {pdf_file.name}")
-                else:
-                    logger.error(f"Failed to process: {pdf_file.name} - {result.error_message}")
-                    
-            except Exception as e:
-                logger.error(f"Error processing {pdf_file.name}: {str(e)}")
-                results[pdf_file.name] = ExtractionResult(
-                    job_id=str(uuid.uuid4()),
-                    status=ProcessingStatus.FAILED,
-                    error_message=str(e)
-                )
+        workers = min(16 if max_workers is None else max_workers, len(pdf_files))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="extract") as executor:
+            # Results are collected in file order, so the returned mapping is ordered as before
+            futures = [executor.submit(self._extract_directory_file, pdf_file, output_dir) for pdf_file in pdf_files]
+            for pdf_file, future in zip(pdf_files, futures):
+                results[pdf_file.name] = future.result()
         
         return results
     
+    def _extract_directory_file(self, pdf_file: Path, output_dir: str) -> ExtractionResult:
+        """
+        Extract one file for extract_from_directory, turning errors into a failed result.
+        
+        Args:
+            pdf_file: PDF file to process
+            output_dir: Directory to save results
+            
+        Returns:
+            ExtractionResult for the file
+        """
+        try:
+            result = self.extract_from_file(str(pdf_file), output_dir)
+            
+            if result.status == ProcessingStatus.COMPLETED:
+                logger.info(f"Successfully processed: {pdf_file.name}")
+            else:
+                logger.error(f"Failed to process: {pdf_file.name} - {result.error_message}")
+            
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error processing {pdf_file.name}: {str(e)}")
+            return ExtractionResult(
+                job_id=str(uuid.uuid4()),
+                status=ProcessingStatus.FAILED,
+                error_message=str(e)
+            )
+    
     def _save_results(self, design_criteria: DesignCriteria, output_dir: str, job_id: str):
         """
         Save extraction results to files.
@@ -144,10 +172,16 @@ class EngineeringCriteriaExtractor:
         job_output_dir = os.path.join(output_dir, job_id)
         os.makedirs(job_output_dir, exist_ok=True)
         
-        # Save JSON results
+        # Save JSON results via a sibling temp file so readers never see a partial file
         json_file = os.path.join(job_output_dir, "extraction_results.json")
-        with open(json_file, 'w') as f:
-            json.dump(design_criteria.dict(), f, indent=2, default=str)
+        fd, tmp_file = tempfile.mkstemp(dir=job_output_dir, suffix='.json.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(design_criteria.dict(), f, indent=2, default=str)
+            os.replace(tmp_file, json_file)
+        except BaseException:
+            os.unlink(tmp_file)
+            raise
         
         # Save raw text
         if design_criteria.raw_text:
@@ -4,13 +4,20 @@ Uses Google Cloud Document AI pre-trained models.
 """
 
 import os
+import re
 import time
 import json
-from typing import Optional, Dict, Any, List
+import functools
+from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, List, Tuple
 from google.api_core.client_options import ClientOptions
 from google.cloud import documentai_v1
 from google.cloud import storage
 import base64
+import numpy as np
+from PIL import Image, ImageDraw, ImageEnhance, ImageFont
 from loguru import logger
 
 from ..models.schemas import (
@@ -21,12 +28,146 @@ from ..models.schemas import (
 from ..models.document_models import DocumentAIResponse, ProcessingStatus
 from .image_extractor import ImageExtractor
 
+try:
+    from .pdf_image_extractor import PDFImageExtractor
+except ImportError:
+    logger.warning("PyMuPDF not available. Page rendering and direct PDF image extraction are disabled. Install with: pip install pymupdf")
+    PDFImageExtractor = None
+
+# Entity crops smaller than this many pixels are degenerate bounding boxes;
+# skip them instead of writing a near-empty PNG for each one.
+MIN_ENTITY_CROP_AREA = 100
+
+# PDFImageExtractor names embedded images pdf_image_{page}_{index}.png
+_PDF_IMG_RE = re.compile(r'^pdf_image_(\d+)')
+
+# Document AI load entity types and the load type each one maps to
+_LOAD_TYPE_MAP = {
+    "BERTHING_LOADS": LoadType.OTHER,
+    "MOORING_LOADS": LoadType.OTHER,
+    "VERTICAL_DEAD_LOADS": LoadType.DEAD_LOAD,
+    "VERTICAL_LIVE_LOADS": LoadType.LIVE_LOAD,
+    "WIND_LOADS": LoadType.WIND_LOAD
+}
+_LOAD_TYPES = frozenset(_LOAD_TYPE_MAP)
+
+# Entity types collected by the generic dictionary-based field parsers
+_STRUCTURAL_TYPES = frozenset({"BEAM", "COLUMN", "SLAB", "WALL", "FOUNDATION", "STRUCTURAL_ELEMENT"})
+_MATERIAL_TYPES = frozenset({"MATERIAL", "STEEL", "CONCRETE", "WOOD", "ALUMINUM", "MATERIAL_SPEC"})
+_SAFETY_TYPES = frozenset({"SAFETY_FACTOR", "FACTOR_OF_SAFETY", "SAFETY_MARGIN", "SAFETY_COEFFICIENT"})
+_ENVIRONMENTAL_TYPES = frozenset({"WIND_LOAD", "SNOW_LOAD", "TEMPERATURE", "HUMIDITY", "ENVIRONMENTAL_CONDITION"})
+
+PLACEHOLDER_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+@functools.lru_cache(maxsize=8)
+def _get_font(path: Optional[str] = None, size: int = 12):
+    """
+    Load a PIL font once and reuse it for every placeholder image.
+    
+    Args:
+        path: TrueType font file, or None for PIL's built-in bitmap font
+        size: Font size in points
+        
+    Returns:
+        The loaded font, falling back to the default font if ``path`` cannot be loaded
+    """
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+        except (OSError, ImportError):
+            pass
+    return ImageFont.load_default()
+
+
+# Blank entity placeholder; per-type templates are drawn on a copy() of it
+_PLACEHOLDER_TEMPLATE = Image.new('RGB', (400, 200), color='lightyellow')
+
+
+@functools.lru_cache(maxsize=64)
+def _typed_placeholder_template(entity_type: str):
+    """Placeholder with the static "Type:" line already drawn; callers draw on a ``copy()`` of it."""
+    img = _PLACEHOLDER_TEMPLATE.copy()
+    draw = ImageDraw.Draw(img, mode='RGB')
+    draw.text((10, 30), f"Type: {entity_type}", fill='black', font=_get_font(PLACEHOLDER_FONT_PATH, 12))
+    return img
+
+
+def _render_entity_placeholder(entity_type: str, entity_index: int, confidence: float, mention_text: str, image_path):
+    """
+    Write a placeholder image describing an entity that could not be cropped.
+    
+    Args:
+        entity_type: Document AI entity type
+        entity_index: 1-based entity number shown on the placeholder
+        confidence: Entity confidence
+        mention_text: Entity text; the first 50 characters are shown
+        image_path: Output PNG path
+    """
+    img = _typed_placeholder_template(entity_type).copy()
+    draw = ImageDraw.Draw(img, mode='RGB')
+    font = _get_font(PLACEHOLDER_FONT_PATH, 12)
+    
+    # Only the per-entity lines are drawn; the "Type:" line (y=30) comes from the template
+    draw.text((10, 10), f"Entity {entity_index}", fill='black', font=font)
+    draw.text((10, 50), f"Confidence: {confidence:.2f}", fill='black', font=font)
+    draw.text((10, 70), f"Text: {mention_text[:50]}...", fill='black', font=font)
+    
+    _save_png(img, image_path)
+
+
+def _pixel_crop_boxes(boxes: np.ndarray, field_types: List[str], page_size) -> np.ndarray:
+    """
+    Convert normalized field bounding boxes on one page to padded pixel crop boxes.
+    
+    Args:
+        boxes: (N, 4) array of normalized ``[x, y, width, height]`` boxes
+        field_types: Field type of each box, used to pick its buffer
+        page_size: (width, height) of the page image in pixels
+        
+    Returns:
+        (N, 5) integer array of ``[x1, y1, x2, y2, buffer]`` per box
+    """
+    img_width, img_height = page_size
+    x, y, width, height = boxes.T
+    field_types = np.asarray(field_types)
+    
+    # Adaptive buffer (in pixels) based on entity type and normalized content size
+    content_size = width * height
+    buffers = np.select(
+        [
+            np.isin(field_types, ('drawing_title', 'drawing_number', 'date')),  # small, precise elements
+            field_types == 'design_criteria',  # longer text
+            content_size < 0.001,  # very small content
+            content_size < 0.01,  # small content
+        ],
+        [5, 10, 15, 12],
+        default=8,  # large content
+    )
+    
+    # (x1, y1) is the top-left and (x2, y2) the bottom-right corner, clamped to the page
+    crop_boxes = np.empty((len(boxes), 5), dtype=np.int64)
+    crop_boxes[:, 0] = np.maximum(0, (x * img_width).astype(np.int64) - buffers)
+    crop_boxes[:, 1] = np.maximum(0, (y * img_height).astype(np.int64) - buffers)
+    crop_boxes[:, 2] = np.minimum(img_width, ((x + width) * img_width).astype(np.int64) + buffers)
+    crop_boxes[:, 3] = np.minimum(img_height, ((y + height) * img_height).astype(np.int64) + buffers)
+    crop_boxes[:, 4] = buffers
+    return crop_boxes
+
+
+def _save_png(image, path: str):
+    """Save an extracted or placeholder image as PNG using fast (level 1) zlib compression."""
+    image.save(path, format='PNG', compress_level=1, optimize=False)
+
 
 class DocumentAIProcessor:
     """
     Processor for extracting engineering design criteria using Google Cloud Document AI.
     """
     
+    # Decoded page images kept while cropping entities; a 300 DPI A1 page is about 200 MB
+    PAGE_ARRAY_CACHE_SIZE = 2
+    
     def __init__(self, project_id: str, processor_id: str, location: str = "us", enable_image_extraction: bool = True):
         """
         Initialize the Document AI processor.
@@ -61,6 +202,9 @@ class DocumentAIProcessor:
                 logger.warning(f"Image extraction disabled: {str(e)}")
                 self.enable_image_extraction = False
         
+        # Rendered page image paths per (file_path, job_id), shared by all cropping passes of a job
+        self._page_images_cache: Dict[tuple, List[str]] = {}
+        
         logger.info(f"Initialized Document AI processor: {self.processor.name}")
     
     def process_document(self, file_path: str) -> DocumentAIResponse:
@@ -180,24 +324,18 @@ class DocumentAIProcessor:
                 
                 # Create a simple placeholder image using PIL
                 try:
-                    from PIL import Image, ImageDraw, ImageFont
-                    
                     # Create a 400x300 placeholder image
                     img = Image.new('RGB', (400, 300), color='lightgray')
                     draw = ImageDraw.Draw(img)
                     
                     # Add text to indicate this is an extracted image
-                    try:
-                        # Try to use a default font
-                        font = ImageFont.load_default()
-                    except:
-                        font = None
+                    font = _get_font()
                     
                     text = f"Extracted Image {i+1}\nPage {image_data.get('page_number', 'Unknown')}"
                     draw.text((50, 150), text, fill='black', font=font)
                     
                     # Save the image
-                    img.save(image_path)
+                    _save_png(img, image_path)
                     extracted_files.append(image_path)
                     
                 except ImportError:
@@ -378,6 +516,9 @@ class DocumentAIProcessor:
         Returns:
             DesignCriteria object with extracted information
         """
+        # Drop page images rendered for an earlier run of the same job
+        self._page_images_cache.pop((file_path, job_id), None)
+        
         # Process document with Document AI
         doc_ai_response = self.process_document(file_path)
         
@@ -401,9 +542,10 @@ class DocumentAIProcessor:
                 else:
                     logger.info("Document AI provided placeholder images, trying direct PDF extraction")
                     try:
-                        from .pdf_image_extractor import PDFImageExtractor
+                        if PDFImageExtractor is None:
+                            raise ImportError("PyMuPDF is not installed")
                         pdf_extractor = PDFImageExtractor()
-                        extracted_image_files = pdf_extractor.extract_images_from_pdf(file_path, job_id)
+                        extracted_image_files = pdf_extractor.extract_images_from_pdf(file_path, job_id, keep_jpeg=True)
                         
                         if extracted_image_files:
                             logger.info(f"Successfully extracted {len(extracted_image_files)} images directly from PDF")
@@ -424,10 +566,7 @@ class DocumentAIProcessor:
                 logger.error(f"Error extracting images: {str(e)}")
         
         # Parse the extracted data into engineering criteria using exact Document AI field names
-        loads = self._parse_loads(doc_ai_response)
-        seismic_forces = self._parse_seismic_forces(doc_ai_response)
-        design_vehicles = self._parse_design_vehicles(doc_ai_response)
-        design_cranes = self._parse_design_cranes(doc_ai_response)
+        loads, seismic_forces, design_vehicles, design_cranes = self._parse_entity_dispatched(doc_ai_response)
         # tables = self._parse_tables(doc_ai_response)  # Removed table extraction
         
         # Parse other specific fields from Document AI configuration
@@ -468,9 +607,10 @@ class DocumentAIProcessor:
         if not doc_ai_images and self.enable_image_extraction:
             logger.info("No images detected by Document AI, trying direct PDF extraction as fallback")
             try:
-                from .pdf_image_extractor import PDFImageExtractor
+                if PDFImageExtractor is None:
+                    raise ImportError("PyMuPDF is not installed")
                 pdf_extractor = PDFImageExtractor()
-                extracted_image_files = pdf_extractor.extract_images_from_pdf(file_path, job_id)
+                extracted_image_files = pdf_extractor.extract_images_from_pdf(file_path, job_id, keep_jpeg=True)
                 
                 if extracted_image_files:
                     # Convert PDF extracted files to ImageData objects
@@ -511,6 +651,9 @@ class DocumentAIProcessor:
             )
             document_ai_entities.append(doc_entity)
         
+        # Page images are only reused within a single extraction
+        self._page_images_cache.pop((file_path, job_id), None)
+        
         # Create document metadata
         metadata = DocumentMetadata(
             filename=os.path.basename(file_path),
@@ -723,11 +866,8 @@ class DocumentAIProcessor:
         """Parse structural elements from Document AI entities."""
         structural_elements = []
         
-        # Look for various structural element types
-        structural_types = ["BEAM", "COLUMN", "SLAB", "WALL", "FOUNDATION", "STRUCTURAL_ELEMENT"]
-        
         for entity in doc_ai_response.entities:
-            if entity.type in structural_types:
+            if entity.type in _STRUCTURAL_TYPES:
                 element = {
                     "type": entity.type.lower(),
                     "text": entity.mention_text,
@@ -743,11 +883,8 @@ class DocumentAIProcessor:
         """Parse material specifications from Document AI entities."""
         material_specs = []
         
-        # Look for material-related entities
-        material_types = ["MATERIAL", "STEEL", "CONCRETE", "WOOD", "ALUMINUM", "MATERIAL_SPEC"]
-        
         for entity in doc_ai_response.entities:
-            if entity.type in material_types:
+            if entity.type in _MATERIAL_TYPES:
                 material = {
                     "type": entity.type.lower(),
                     "text": entity.mention_text,
@@ -763,11 +900,8 @@ class DocumentAIProcessor:
         """Parse safety factors from Document AI entities."""
         safety_factors = []
         
-        # Look for safety factor related entities
-        safety_types = ["SAFETY_FACTOR", "FACTOR_OF_SAFETY", "SAFETY_MARGIN", "SAFETY_COEFFICIENT"]
-        
         for entity in doc_ai_response.entities:
-            if entity.type in safety_types:
+            if entity.type in _SAFETY_TYPES:
                 safety = {
                     "type": entity.type.lower(),
                     "text": entity.mention_text,
@@ -783,11 +917,8 @@ class DocumentAIProcessor:
         """Parse environmental conditions from Document AI entities."""
         environmental_conditions = []
         
-        # Look for environmental condition entities
-        env_types = ["WIND_LOAD", "SNOW_LOAD", "TEMPERATURE", "HUMIDITY", "ENVIRONMENTAL_CONDITION"]
-        
         for entity in doc_ai_response.entities:
-            if entity.type in env_types:
+            if entity.type in _ENVIRONMENTAL_TYPES:
                 condition = {
                     "type": entity.type.lower(),
                     "text": entity.mention_text,
@@ -804,8 +935,6 @@ class DocumentAIProcessor:
         loads = []
         
         # Look for load patterns in the text
-        import re
-        
         # Pattern for live loads (e.g., "LIVE LOAD: 10kPa")
         live_load_pattern = r'LIVE\s+LOAD[:\s]*(\d+(?:\.\d+)?)\s*(kPa|kN/m²|kN/m2)'
         live_load_matches = re.findall(live_load_pattern, text, re.IGNORECASE)
@@ -854,8 +983,6 @@ class DocumentAIProcessor:
         """Extract design vehicles from text using pattern matching."""
         vehicles = []
         
-        import re
-        
         # Pattern for design vehicle (e.g., "DESIGN VEHICLE: 12.5+ 12.5+ 6.0t")
         vehicle_pattern = r'DESIGN\s+VEHICLE[:\s]*([^.\n]+)'
         vehicle_matches = re.findall(vehicle_pattern, text, re.IGNORECASE)
@@ -879,8 +1006,6 @@ class DocumentAIProcessor:
         """Extract design cranes from text using pattern matching."""
         cranes = []
         
-        import re
-        
         # Pattern for design crane (e.g., "DESIGN CRANE: 4.25m 4.75m")
         crane_pattern = r'DESIGN\s+CRANE[:\s]*([^.\n]+)'
         crane_matches = re.findall(crane_pattern, text, re.IGNORECASE)
@@ -924,8 +1049,6 @@ class DocumentAIProcessor:
                         
                         # For now, create a placeholder since Document AI doesn't provide raw image data
                         # In a production system, you would use Document AI Toolbox's export_images method
-                        from PIL import Image, ImageDraw, ImageFont
-                        
                         # Create a placeholder image with bounding box info
                         img = Image.new('RGB', (400, 300), color='lightblue')
                         draw = ImageDraw.Draw(img)
@@ -934,14 +1057,10 @@ class DocumentAIProcessor:
                         bbox = image_info['bounding_box']
                         text = f"Document AI Image {i+1}\nPage: {image_info.get('page_number', 'Unknown')}\nConfidence: {image_info.get('confidence', 0.0):.2f}\nBBox: ({bbox['x']:.0f}, {bbox['y']:.0f}, {bbox['width']:.0f}, {bbox['height']:.0f})"
                         
-                        # Try to use a default font, fallback to default if not available
-                        try:
-                            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-                        except:
-                            font = ImageFont.load_default()
+                        font = _get_font(PLACEHOLDER_FONT_PATH, 12)
                         
                         draw.text((10, 10), text, fill='black', font=font)
-                        img.save(image_path)
+                        _save_png(img, image_path)
                         
                         # Create ImageData object
                         image_data = ImageData(
@@ -967,6 +1086,33 @@ class DocumentAIProcessor:
         
         return extracted_images
     
+    def _get_page_images(self, file_path: str, job_id: str) -> List[str]:
+        """
+        Render the PDF pages as images once per job and reuse them for every cropping pass.
+        
+        Args:
+            file_path: Path to the PDF file
+            job_id: Job identifier for organizing extracted images
+            
+        Returns:
+            List of page image paths, in page order
+        """
+        cache_key = (file_path, job_id)
+        page_images = self._page_images_cache.get(cache_key)
+        if page_images and all(os.path.exists(page_path) for page_path in page_images):
+            return page_images
+        
+        if PDFImageExtractor is None:
+            logger.warning("PyMuPDF not available; cannot render page images for cropping")
+            return []
+        
+        pdf_extractor = PDFImageExtractor()
+        # Crops are cut from these renders, so keep them at full resolution
+        page_images = pdf_extractor.extract_pages_as_images(file_path, job_id, target_max_px=None)
+        if page_images:
+            self._page_images_cache[cache_key] = page_images
+        return page_images
+    
     def _extract_entity_images(self, doc_ai_response: DocumentAIResponse, file_path: str, job_id: str) -> List[ImageData]:
         """
         Extract images for each Document AI entity using their bounding boxes.
@@ -980,9 +1126,7 @@ class DocumentAIProcessor:
             os.makedirs(job_output_dir, exist_ok=True)
             
             # Get PDF page images for cropping
-            from .pdf_image_extractor import PDFImageExtractor
-            pdf_extractor = PDFImageExtractor()
-            page_images = pdf_extractor.extract_pages_as_images(file_path, job_id)
+            page_images = self._get_page_images(file_path, job_id)
             
             if not page_images:
                 logger.warning("No page images available for entity cropping")
@@ -991,6 +1135,8 @@ class DocumentAIProcessor:
             # Process each entity with bounding box information
             for i, entity in enumerate(doc_ai_response.entities):
                 try:
+                    etype_lower = entity.type.lower()
+                    etype_flat = etype_lower.replace('_', '')
                     logger.info(f"Processing entity {i+1}: {entity.type}")
                     
                     # Check if entity has bounding box information
@@ -1018,56 +1164,29 @@ class DocumentAIProcessor:
                         logger.info(f"Entity {entity.type} coordinates: x={x}, y={y}, width={width}, height={height}")
                         
                         # Create entity-specific image filename
-                        entity_filename = f"entity_{entity.type.lower().replace('_', '')}_{i+1}.png"
+                        entity_filename = f"entity_{etype_flat}_{i+1}.png"
                         entity_image_path = os.path.join(job_output_dir, entity_filename)
                         
-                        # Crop the image using PIL
-                        from PIL import Image
-                        
                         try:
                             with Image.open(page_image_path) as page_img:
-                                # Get page dimensions
-                                page_width, page_height = page_img.size
-                                logger.info(f"Page image dimensions: {page_width}x{page_height}")
-                                
-                                # Convert normalized coordinates to pixel coordinates
-                                # Document AI coordinates are normalized (0-1)
-                                pixel_x = int(x * page_width)
-                                pixel_y = int(y * page_height)
-                                pixel_width = int(width * page_width)
-                                pixel_height = int(height * page_height)
-                                
-                                logger.info(f"Pixel coordinates: x={pixel_x}, y={pixel_y}, width={pixel_width}, height={pixel_height}")
-                                
-                                # Ensure coordinates are within bounds
-                                pixel_x = max(0, min(pixel_x, page_width - 1))
-                                pixel_y = max(0, min(pixel_y, page_height - 1))
-                                pixel_width = max(1, min(pixel_width, page_width - pixel_x))
-                                pixel_height = max(1, min(pixel_height, page_height - pixel_y))
-                                
-                                # Crop the image
-                                cropped_img = page_img.crop((pixel_x, pixel_y, pixel_x + pixel_width, pixel_y + pixel_height))
-                                
-                                # Save the cropped image
-                                cropped_img.save(entity_image_path)
-                                
-                                # Create ImageData object
-                                image_data = ImageData(
-                                    image_id=f"entity_{entity.type.lower()}_{i+1}",
-                                    page_number=page_number,
-                                    bounding_box={
-                                        'x': x,
-                                        'y': y,
-                                        'width': width,
-                                        'height': height
-                                    },
-                                    image_type=f"entity_{entity.type.lower()}",
-                                    description=f"{entity.type} entity: {entity.mention_text[:100]}...",
-                                    confidence=entity.confidence,
-                                    file_path=os.path.join(job_id, entity_filename)
-                                )
-                                extracted_images.append(image_data)
-                                logger.info(f"Extracted image for {entity.type} entity: {entity_filename}")
+                                page_arr = np.asarray(page_img.convert('RGB'))
+                            bbox_dict = self._crop_and_save(page_arr, x, y, width, height, entity_image_path)
+                            
+                            if bbox_dict is None:
+                                continue
+                            
+                            # Create ImageData object
+                            image_data = ImageData(
+                                image_id=f"entity_{etype_lower}_{i+1}",
+                                page_number=page_number,
+                                bounding_box=bbox_dict,
+                                image_type=f"entity_{etype_lower}",
+                                description=f"{entity.type} entity: {entity.mention_text[:100]}...",
+                                confidence=entity.confidence,
+                                file_path=os.path.join(job_id, entity_filename)
+                            )
+                            extracted_images.append(image_data)
+                            logger.info(f"Extracted image for {entity.type} entity: {entity_filename}")
                         
                         except Exception as e:
                             logger.warning(f"Failed to crop image for {entity.type} entity: {str(e)}")
@@ -1075,7 +1194,7 @@ class DocumentAIProcessor:
                             self._create_entity_placeholder(entity, entity_image_path, i+1)
                             
                             image_data = ImageData(
-                                image_id=f"entity_{entity.type.lower()}_{i+1}",
+                                image_id=f"entity_{etype_lower}_{i+1}",
                                 page_number=page_number,
                                 bounding_box={
                                     'x': x,
@@ -1083,7 +1202,7 @@ class DocumentAIProcessor:
                                     'width': width,
                                     'height': height
                                 },
-                                image_type=f"entity_{entity.type.lower()}_placeholder",
+                                image_type=f"entity_{etype_lower}_placeholder",
                                 description=f"{entity.type} entity (placeholder): {entity.mention_text[:100]}...",
                                 confidence=entity.confidence,
                                 file_path=os.path.join(job_id, entity_filename)
@@ -1092,15 +1211,15 @@ class DocumentAIProcessor:
                     else:
                         logger.info(f"Entity {entity.type} has no bounding box information")
                         # Create a placeholder image for entities without bounding box
-                        entity_filename = f"entity_{entity.type.lower().replace('_', '')}_{i+1}_placeholder.png"
+                        entity_filename = f"entity_{etype_flat}_{i+1}_placeholder.png"
                         entity_image_path = os.path.join(job_output_dir, entity_filename)
                         self._create_entity_placeholder(entity, entity_image_path, i+1)
                         
                         image_data = ImageData(
-                            image_id=f"entity_{entity.type.lower()}_{i+1}",
+                            image_id=f"entity_{etype_lower}_{i+1}",
                             page_number=1,
                             bounding_box=None,
-                            image_type=f"entity_{entity.type.lower()}_placeholder",
+                            image_type=f"entity_{etype_lower}_placeholder",
                             description=f"{entity.type} entity (no bbox): {entity.mention_text[:100]}...",
                             confidence=entity.confidence,
                             file_path=os.path.join(job_id, entity_filename)
@@ -1124,53 +1243,29 @@ class DocumentAIProcessor:
                         height = getattr(bbox, 'height', 0)
                         
                         # Create entity-specific image filename
-                        entity_filename = f"entity_{entity.type.lower().replace('_', '')}_{i+1}.png"
+                        entity_filename = f"entity_{etype_flat}_{i+1}.png"
                         entity_image_path = os.path.join(job_output_dir, entity_filename)
                         
-                        # Crop the image using PIL
-                        from PIL import Image
-                        
                         try:
                             with Image.open(page_image_path) as page_img:
-                                # Get page dimensions
-                                page_width, page_height = page_img.size
-                                
-                                # Convert normalized coordinates to pixel coordinates
-                                # Document AI coordinates are normalized (0-1)
-                                pixel_x = int(x * page_width)
-                                pixel_y = int(y * page_height)
-                                pixel_width = int(width * page_width)
-                                pixel_height = int(height * page_height)
-                                
-                                # Ensure coordinates are within bounds
-                                pixel_x = max(0, min(pixel_x, page_width - 1))
-                                pixel_y = max(0, min(pixel_y, page_height - 1))
-                                pixel_width = max(1, min(pixel_width, page_width - pixel_x))
-                                pixel_height = max(1, min(pixel_height, page_height - pixel_y))
-                                
-                                # Crop the image
-                                cropped_img = page_img.crop((pixel_x, pixel_y, pixel_x + pixel_width, pixel_y + pixel_height))
-                                
-                                # Save the cropped image
-                                cropped_img.save(entity_image_path)
-                                
-                                # Create ImageData object
-                                image_data = ImageData(
-                                    image_id=f"entity_{entity.type.lower()}_{i+1}",
-                                    page_number=page_number,
-                                    bounding_box={
-                                        'x': x,
-                                        'y': y,
-                                        'width': width,
-                                        'height': height
-                                    },
-                                    image_type=f"entity_{entity.type.lower()}",
-                                    description=f"{entity.type} entity: {entity.mention_text[:100]}...",
-                                    confidence=entity.confidence,
-                                    file_path=os.path.join(job_id, entity_filename)
-                                )
-                                extracted_images.append(image_data)
-                                logger.info(f"Extracted image for {entity.type} entity: {entity_filename}")
+                                page_arr = np.asarray(page_img.convert('RGB'))
+                            bbox_dict = self._crop_and_save(page_arr, x, y, width, height, entity_image_path)
+                            
+                            if bbox_dict is None:
+                                continue
+                            
+                            # Create ImageData object
+                            image_data = ImageData(
+                                image_id=f"entity_{etype_lower}_{i+1}",
+                                page_number=page_number,
+                                bounding_box=bbox_dict,
+                                image_type=f"entity_{etype_lower}",
+                                description=f"{entity.type} entity: {entity.mention_text[:100]}...",
+                                confidence=entity.confidence,
+                                file_path=os.path.join(job_id, entity_filename)
+                            )
+                            extracted_images.append(image_data)
+                            logger.info(f"Extracted image for {entity.type} entity: {entity_filename}")
                         
                         except Exception as e:
                             logger.warning(f"Failed to crop image for {entity.type} entity: {str(e)}")
@@ -1178,7 +1273,7 @@ class DocumentAIProcessor:
                             self._create_entity_placeholder(entity, entity_image_path, i+1)
                             
                             image_data = ImageData(
-                                image_id=f"entity_{entity.type.lower()}_{i+1}",
+                                image_id=f"entity_{etype_lower}_{i+1}",
                                 page_number=page_number,
                                 bounding_box={
                                     'x': x,
@@ -1186,7 +1281,7 @@ class DocumentAIProcessor:
                                     'width': width,
                                     'height': height
                                 },
-                                image_type=f"entity_{entity.type.lower()}_placeholder",
+                                image_type=f"entity_{etype_lower}_placeholder",
                                 description=f"{entity.type} entity (placeholder): {entity.mention_text[:100]}...",
                                 confidence=entity.confidence,
                                 file_path=os.path.join(job_id, entity_filename)
@@ -1212,41 +1307,41 @@ class DocumentAIProcessor:
         
         try:
             # Create job-specific output directory
-            job_output_dir = os.path.join("data/extracted_images", job_id)
-            os.makedirs(job_output_dir, exist_ok=True)
+            job_output_dir = Path("data/extracted_images") / job_id
+            job_output_dir.mkdir(parents=True, exist_ok=True)
+            rel_prefix = job_id + os.sep
             
             # Get PDF page images for cropping
-            from .pdf_image_extractor import PDFImageExtractor
-            pdf_extractor = PDFImageExtractor()
-            page_images = pdf_extractor.extract_pages_as_images(file_path, job_id)
+            page_images = self._get_page_images(file_path, job_id)
             
             if not page_images:
                 logger.warning("No page images available for entity cropping")
                 return extracted_images
             
+            # Crops are encoded and written in the background while the loop continues
+            save_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+            pending_saves = {}
+            
+            # Decoded RGB page arrays by page index, shared by entities on the same page;
+            # only the most recently used pages are kept
+            page_arrays = {}
+            
             # Process each entity with bounding box information from original Document AI response
             for i, entity in enumerate(original_document.entities):
                 try:
-                    logger.info(f"Processing entity {i+1}: {entity.type_} with original Document AI response")
+                    etype = entity.type_
+                    etype_lower = etype.lower()
+                    etype_flat = etype_lower.replace('_', '')
+                    mtext_100 = entity.mention_text[:100]
+                    # ImageData fields shared by the cropped and placeholder variants
+                    shared_fields = {
+                        'image_id': f"entity_{etype_lower}_{i+1}",
+                        'confidence': entity.confidence,
+                    }
+                    logger.debug("Processing entity {}: {} with original Document AI response", i + 1, etype)
                     
-                    # Debug: Log the entity structure
-                    logger.info(f"Entity {entity.type_} structure:")
-                    logger.info(f"  - has page_anchor: {hasattr(entity, 'page_anchor')}")
-                    if hasattr(entity, 'page_anchor') and entity.page_anchor:
-                        logger.info(f"  - page_anchor: {entity.page_anchor}")
-                        logger.info(f"  - has page_refs: {hasattr(entity.page_anchor, 'page_refs')}")
-                        if hasattr(entity.page_anchor, 'page_refs') and entity.page_anchor.page_refs:
-                            logger.info(f"  - page_refs length: {len(entity.page_anchor.page_refs)}")
-                            page_ref = entity.page_anchor.page_refs[0]
-                            logger.info(f"  - page_ref: {page_ref}")
-                            logger.info(f"  - has bounding_poly: {hasattr(page_ref, 'bounding_poly')}")
-                            if hasattr(page_ref, 'bounding_poly') and page_ref.bounding_poly:
-                                logger.info(f"  - bounding_poly: {page_ref.bounding_poly}")
-                                logger.info(f"  - has vertices: {hasattr(page_ref.bounding_poly, 'vertices')}")
-                                if hasattr(page_ref.bounding_poly, 'vertices') and page_ref.bounding_poly.vertices:
-                                    logger.info(f"  - vertices length: {len(page_ref.bounding_poly.vertices)}")
-                                    for j, vertex in enumerate(page_ref.bounding_poly.vertices):
-                                        logger.info(f"    - vertex {j}: x={vertex.x}, y={vertex.y}")
+                    # The structure dump is only built when debug logging is enabled
+                    logger.opt(lazy=True).debug("Entity {} structure:\n{}", lambda: etype, lambda: self._describe_entity_anchor(entity))
                     
                     # Extract bounding box from original Document AI entity
                     bounding_box = None
@@ -1272,7 +1367,7 @@ class DocumentAIProcessor:
                                     "width": x_max - x_min,
                                     "height": y_max - y_min
                                 }
-                                logger.info(f"Entity {entity.type_} has bounding box: {bounding_box}")
+                                logger.debug("Entity {} has bounding box: {}", etype, bounding_box)
                     
                     if bounding_box:
                         # Ensure page number is within range
@@ -1285,7 +1380,7 @@ class DocumentAIProcessor:
                         # So we need: page_images[page_number] instead of page_images[page_number - 1]
                         page_index = page_number if page_number < len(page_images) else 0
                         page_image_path = page_images[page_index]
-                        logger.info(f"Entity {entity.type_} on Document AI page {page_number} using {os.path.basename(page_image_path)} (index {page_index})")
+                        logger.debug("Entity {} on Document AI page {} using {} (index {})", etype, page_number, page_image_path, page_index)
                         
                         # Extract coordinates
                         x = bounding_box["x"]
@@ -1293,85 +1388,66 @@ class DocumentAIProcessor:
                         width = bounding_box["width"]
                         height = bounding_box["height"]
                         
-                        logger.info(f"Entity {entity.type_} coordinates: x={x}, y={y}, width={width}, height={height}")
-                        
                         # Create entity-specific image filename
-                        entity_filename = f"entity_{entity.type_.lower().replace('_', '')}_{i+1}.png"
-                        entity_image_path = os.path.join(job_output_dir, entity_filename)
-                        
-                        # Crop the image using PIL
-                        from PIL import Image
+                        entity_filename = f"entity_{etype_flat}_{i+1}.png"
+                        entity_image_path = job_output_dir / entity_filename
                         
                         try:
-                            with Image.open(page_image_path) as page_img:
-                                # Get page dimensions
-                                page_width, page_height = page_img.size
-                                logger.info(f"Page image dimensions: {page_width}x{page_height}")
-                                
-                                # Convert normalized coordinates to pixel coordinates
-                                # Document AI coordinates are normalized (0-1)
-                                pixel_x = int(x * page_width)
-                                pixel_y = int(y * page_height)
-                                pixel_width = int(width * page_width)
-                                pixel_height = int(height * page_height)
-                                
-                                logger.info(f"Pixel coordinates: x={pixel_x}, y={pixel_y}, width={pixel_width}, height={pixel_height}")
-                                
-                                # Ensure coordinates are within bounds
-                                pixel_x = max(0, min(pixel_x, page_width - 1))
-                                pixel_y = max(0, min(pixel_y, page_height - 1))
-                                pixel_width = max(1, min(pixel_width, page_width - pixel_x))
-                                pixel_height = max(1, min(pixel_height, page_height - pixel_y))
-                                
-                                # Crop the image
-                                cropped_img = page_img.crop((pixel_x, pixel_y, pixel_x + pixel_width, pixel_y + pixel_height))
-                                
-                                # Save the cropped image
-                                cropped_img.save(entity_image_path)
-                                
-                                # Create ImageData object
-                                image_data = ImageData(
-                                    image_id=f"entity_{entity.type_.lower()}_{i+1}",
-                                    page_number=page_number,
-                                    bounding_box=bounding_box,
-                                    image_type=f"entity_{entity.type_.lower()}",
-                                    description=f"{entity.type_} entity: {entity.mention_text[:100]}...",
-                                    confidence=entity.confidence,
-                                    file_path=os.path.join(job_id, entity_filename)
-                                )
-                                extracted_images.append(image_data)
-                                logger.info(f"Extracted image for {entity.type_} entity: {entity_filename}")
+                            page_arr = page_arrays.pop(page_index, None)
+                            if page_arr is None:
+                                if len(page_arrays) >= self.PAGE_ARRAY_CACHE_SIZE:
+                                    # Drop the least recently used page before decoding another
+                                    page_arrays.pop(next(iter(page_arrays)))
+                                with Image.open(page_image_path) as page_img:
+                                    page_arr = np.asarray(page_img.convert('RGB'))
+                            page_arrays[page_index] = page_arr
+                            
+                            bbox_dict = self._crop_and_save(page_arr, x, y, width, height, entity_image_path,
+                                                            save_executor, pending_saves)
+                            
+                            if bbox_dict is None:
+                                continue
+                            
+                            # Create ImageData object
+                            image_data = ImageData(
+                                **shared_fields,
+                                page_number=page_number,
+                                bounding_box=bbox_dict,
+                                image_type=f"entity_{etype_lower}",
+                                description=f"{etype} entity: {mtext_100}...",
+                                file_path=rel_prefix + entity_filename
+                            )
+                            extracted_images.append(image_data)
+                            logger.debug("Extracted image for {} entity: {}", etype, entity_filename)
                         
                         except Exception as e:
-                            logger.warning(f"Failed to crop image for {entity.type_} entity: {str(e)}")
+                            logger.warning(f"Failed to crop image for {etype} entity: {str(e)}")
                             # Create a placeholder image instead
                             self._create_entity_placeholder_from_original(entity, entity_image_path, i+1)
                             
                             image_data = ImageData(
-                                image_id=f"entity_{entity.type_.lower()}_{i+1}",
+                                **shared_fields,
                                 page_number=page_number,
                                 bounding_box=bounding_box,
-                                image_type=f"entity_{entity.type_.lower()}_placeholder",
-                                description=f"{entity.type_} entity (placeholder): {entity.mention_text[:100]}...",
-                                confidence=entity.confidence,
-                                file_path=os.path.join(job_id, entity_filename)
+                                image_type=f"entity_{etype_lower}_placeholder",
+                                description=f"{etype} entity (placeholder): {mtext_100}...",
+                                file_path=rel_prefix + entity_filename
                             )
                             extracted_images.append(image_data)
                     else:
-                        logger.info(f"Entity {entity.type_} has no bounding box information")
+                        logger.debug("Entity {} has no bounding box information", etype)
                         # Create a placeholder image for entities without bounding box
-                        entity_filename = f"entity_{entity.type_.lower().replace('_', '')}_{i+1}_placeholder.png"
-                        entity_image_path = os.path.join(job_output_dir, entity_filename)
+                        entity_filename = f"entity_{etype_flat}_{i+1}_placeholder.png"
+                        entity_image_path = job_output_dir / entity_filename
                         self._create_entity_placeholder_from_original(entity, entity_image_path, i+1)
                         
                         image_data = ImageData(
-                            image_id=f"entity_{entity.type_.lower()}_{i+1}",
+                            **shared_fields,
                             page_number=page_number,
                             bounding_box=None,
-                            image_type=f"entity_{entity.type_.lower()}_placeholder",
-                            description=f"{entity.type_} entity (no bbox): {entity.mention_text[:100]}...",
-                            confidence=entity.confidence,
-                            file_path=os.path.join(job_id, entity_filename)
+                            image_type=f"entity_{etype_lower}_placeholder",
+                            description=f"{etype} entity (no bbox): {mtext_100}...",
+                            file_path=rel_prefix + entity_filename
                         )
                         extracted_images.append(image_data)
                     
@@ -1379,6 +1455,9 @@ class DocumentAIProcessor:
                     logger.warning(f"Failed to process entity {i+1} ({getattr(entity, 'type_', 'Unknown')}): {str(e)}")
                     continue
             
+            save_executor.shutdown(wait=False)
+            extracted_images = self._wait_for_saves(pending_saves, extracted_images)
+            
             logger.info(f"Successfully extracted {len(extracted_images)} entity images with bounding boxes")
             
         except Exception as e:
@@ -1386,35 +1465,105 @@ class DocumentAIProcessor:
         
         return extracted_images
     
+    def _describe_entity_anchor(self, entity) -> str:
+        """Describe an entity's page anchor, page ref and bounding poly for debug logging."""
+        lines = [f"  - has page_anchor: {hasattr(entity, 'page_anchor')}"]
+        if hasattr(entity, 'page_anchor') and entity.page_anchor:
+            lines.append(f"  - page_anchor: {entity.page_anchor}")
+            lines.append(f"  - has page_refs: {hasattr(entity.page_anchor, 'page_refs')}")
+            if hasattr(entity.page_anchor, 'page_refs') and entity.page_anchor.page_refs:
+                lines.append(f"  - page_refs length: {len(entity.page_anchor.page_refs)}")
+                page_ref = entity.page_anchor.page_refs[0]
+                lines.append(f"  - page_ref: {page_ref}")
+                lines.append(f"  - has bounding_poly: {hasattr(page_ref, 'bounding_poly')}")
+                if hasattr(page_ref, 'bounding_poly') and page_ref.bounding_poly:
+                    lines.append(f"  - bounding_poly: {page_ref.bounding_poly}")
+                    lines.append(f"  - has vertices: {hasattr(page_ref.bounding_poly, 'vertices')}")
+                    if hasattr(page_ref.bounding_poly, 'vertices') and page_ref.bounding_poly.vertices:
+                        lines.append(f"  - vertices length: {len(page_ref.bounding_poly.vertices)}")
+                        for j, vertex in enumerate(page_ref.bounding_poly.vertices):
+                            lines.append(f"    - vertex {j}: x={vertex.x}, y={vertex.y}")
+        return "\n".join(lines)
+    
+    def _crop_and_save(self, page_arr: np.ndarray, x: float, y: float, width: float, height: float, out_path: str,
+                       save_executor=None, pending_saves: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, float]]:
+        """
+        Crop a normalized (0-1) bounding box out of a decoded (height, width, 3) page array and save it.
+        
+        When ``save_executor`` is given the PNG is encoded and written in the
+        background and its future is recorded in ``pending_saves`` by output path.
+        
+        Returns the bounding box dict to store on the ImageData, or None when the
+        box is smaller than MIN_ENTITY_CROP_AREA pixels and nothing was written.
+        """
+        # Get page dimensions
+        page_height, page_width = page_arr.shape[:2]
+        
+        # Convert normalized coordinates to pixel coordinates
+        # Document AI coordinates are normalized (0-1)
+        pixel_x = int(x * page_width)
+        pixel_y = int(y * page_height)
+        pixel_width = int(width * page_width)
+        pixel_height = int(height * page_height)
+        
+        logger.debug(
+            "Cropping {} on {}x{} page: x={}, y={}, width={}, height={}",
+            os.path.basename(out_path), page_width, page_height, pixel_x, pixel_y, pixel_width, pixel_height
+        )
+        
+        if pixel_width * pixel_height < MIN_ENTITY_CROP_AREA:
+            logger.debug("Skipping {}: crop area {}x{} is smaller than {} pixels",
+                         os.path.basename(out_path), pixel_width, pixel_height, MIN_ENTITY_CROP_AREA)
+            return None
+        
+        # Ensure coordinates are within bounds
+        pixel_x = max(0, min(pixel_x, page_width - 1))
+        pixel_y = max(0, min(pixel_y, page_height - 1))
+        pixel_width = max(1, min(pixel_width, page_width - pixel_x))
+        pixel_height = max(1, min(pixel_height, page_height - pixel_y))
+        
+        # Crop and save the image
+        cropped_img = Image.fromarray(page_arr[pixel_y:pixel_y + pixel_height, pixel_x:pixel_x + pixel_width])
+        if save_executor is not None:
+            pending_saves[out_path] = save_executor.submit(_save_png, cropped_img, out_path)
+        else:
+            _save_png(cropped_img, out_path)
+        
+        return {
+            'x': x,
+            'y': y,
+            'width': width,
+            'height': height
+        }
+    
+    def _wait_for_saves(self, pending_saves: Dict[str, Any], images: List[ImageData]) -> List[ImageData]:
+        """
+        Wait for background image saves and drop images whose file failed to write.
+        
+        Args:
+            pending_saves: Mapping of output path to the future saving it
+            images: ImageData objects referring to those files
+            
+        Returns:
+            The images whose files were saved successfully
+        """
+        wait(pending_saves.values())
+        
+        failed_files = set()
+        for out_path, future in pending_saves.items():
+            error = future.exception()
+            if error is not None:
+                logger.warning(f"Failed to save {os.path.basename(out_path)}: {str(error)}")
+                failed_files.add(os.path.basename(out_path))
+        
+        if not failed_files:
+            return images
+        return [image for image in images if os.path.basename(image.file_path) not in failed_files]
+    
     def _create_entity_placeholder_from_original(self, entity, image_path: str, entity_index: int):
         """Create a placeholder image for an entity from original Document AI response."""
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            
-            # Create a placeholder image
-            img = Image.new('RGB', (400, 200), color='lightyellow')
-            draw = ImageDraw.Draw(img)
-            
-            # Add entity information
-            text_lines = [
-                f"Entity {entity_index}",
-                f"Type: {entity.type_}",
-                f"Confidence: {entity.confidence:.2f}",
-                f"Text: {entity.mention_text[:50]}..."
-            ]
-            
-            # Try to use a default font
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-            except:
-                font = ImageFont.load_default()
-            
-            y_offset = 10
-            for line in text_lines:
-                draw.text((10, y_offset), line, fill='black', font=font)
-                y_offset += 20
-            
-            img.save(image_path)
+            _render_entity_placeholder(entity.type_, entity_index, entity.confidence, entity.mention_text, image_path)
             logger.info(f"Created placeholder for {entity.type_} entity")
             
         except Exception as e:
@@ -1423,32 +1572,7 @@ class DocumentAIProcessor:
     def _create_entity_placeholder(self, entity, image_path: str, entity_index: int):
         """Create a placeholder image for an entity when cropping fails."""
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            
-            # Create a placeholder image
-            img = Image.new('RGB', (400, 200), color='lightyellow')
-            draw = ImageDraw.Draw(img)
-            
-            # Add entity information
-            text_lines = [
-                f"Entity {entity_index}",
-                f"Type: {entity.type}",
-                f"Confidence: {entity.confidence:.2f}",
-                f"Text: {entity.mention_text[:50]}..."
-            ]
-            
-            # Try to use a default font
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-            except:
-                font = ImageFont.load_default()
-            
-            y_offset = 10
-            for line in text_lines:
-                draw.text((10, y_offset), line, fill='black', font=font)
-                y_offset += 20
-            
-            img.save(image_path)
+            _render_entity_placeholder(entity.type, entity_index, entity.confidence, entity.mention_text, image_path)
             logger.info(f"Created placeholder for {entity.type} entity")
             
         except Exception as e:
@@ -1462,32 +1586,38 @@ class DocumentAIProcessor:
         extracted_images = []
         
         # Check if any engineering fields were detected
-        has_engineering_fields = (
-            loads or 
-            seismic_forces or 
-            design_vehicles or 
-            design_cranes or
-            tables or
-            design_criteria or
-            design_loads or
-            drg_no or
-            title or
-            date
-        )
-        
-        if not has_engineering_fields:
+        if not any((loads, seismic_forces, design_vehicles, design_cranes, tables,
+                    design_criteria, design_loads, drg_no, title, date)):
             logger.info("No engineering fields detected. Skipping image extraction.")
             return []
         
         try:
             # Create job-specific output directory
-            job_output_dir = os.path.join("data/extracted_images", job_id)
-            os.makedirs(job_output_dir, exist_ok=True)
+            job_output_dir = Path("data/extracted_images") / job_id
+            job_output_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Collect every field bounding box into one list of crop jobs
+            crop_jobs = []
+            crop_jobs.extend((load.bounding_box, load.description, "load") for load in loads if load.bounding_box)
+            crop_jobs.extend((seismic.bounding_box, seismic.description, "seismic_force") for seismic in seismic_forces if seismic.bounding_box)
+            crop_jobs.extend((vehicle.bounding_box, vehicle.description, "design_vehicle") for vehicle in design_vehicles if vehicle.bounding_box)
+            crop_jobs.extend((crane.bounding_box, crane.description, "design_crane") for crane in design_cranes if crane.bounding_box)
+            crop_jobs.extend((table.bounding_box, f"Table {table.table_id}", "table") for table in tables if table.bounding_box)
+            for items, field_type in (
+                (design_criteria, "design_criteria"),
+                (design_loads, "design_loads"),
+                (drg_no, "drg_no"),
+                (title, "title"),
+                (date, "date"),
+            ):
+                crop_jobs.extend((item['bounding_box'], item['text'], field_type) for item in items if item.get('bounding_box'))
+            
+            if not crop_jobs:
+                logger.info("No engineering fields have bounding boxes. Skipping page rendering and image extraction.")
+                return []
             
             # Extract full page images first for cropping
-            from .pdf_image_extractor import PDFImageExtractor
-            pdf_extractor = PDFImageExtractor()
-            page_images = pdf_extractor.extract_pages_as_images(file_path, job_id)
+            page_images = self._get_page_images(file_path, job_id)
             
             if not page_images:
                 logger.warning("Could not extract page images for cropping. Skipping field-specific image extraction.")
@@ -1509,117 +1639,65 @@ class DocumentAIProcessor:
                     except ValueError:
                         continue
             
-            image_count = 0
-            
-            # Extract images for loads
-            for load in loads:
-                if load.bounding_box:
-                    image_data = self._crop_image_from_bounding_box(
-                        load.bounding_box, load.description, "load", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
-            
-            # Extract images for seismic forces
-            for seismic in seismic_forces:
-                if seismic.bounding_box:
-                    image_data = self._crop_image_from_bounding_box(
-                        seismic.bounding_box, seismic.description, "seismic_force", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
-            
-            # Extract images for design vehicles
-            for vehicle in design_vehicles:
-                if vehicle.bounding_box:
-                    image_data = self._crop_image_from_bounding_box(
-                        vehicle.bounding_box, vehicle.description, "design_vehicle", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
-            
-            # Extract images for design cranes
-            for crane in design_cranes:
-                if crane.bounding_box:
-                    image_data = self._crop_image_from_bounding_box(
-                        crane.bounding_box, crane.description, "design_crane", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
-            
-            # Extract images for tables
-            for table in tables:
-                if table.bounding_box:
-                    image_data = self._crop_image_from_bounding_box(
-                        table.bounding_box, f"Table {table.table_id}", "table", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
-            
-            # Extract images for design criteria
-            for criteria in design_criteria:
-                if criteria.get('bounding_box'):
-                    image_data = self._crop_image_from_bounding_box(
-                        criteria['bounding_box'], criteria['text'], "design_criteria", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
-            
-            # Extract images for design loads
-            for load in design_loads:
-                if load.get('bounding_box'):
-                    image_data = self._crop_image_from_bounding_box(
-                        load['bounding_box'], load['text'], "design_loads", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
-            
-            # Extract images for DRG numbers
-            for drg in drg_no:
-                if drg.get('bounding_box'):
-                    image_data = self._crop_image_from_bounding_box(
-                        drg['bounding_box'], drg['text'], "drg_no", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
+            # Group the jobs by page so each page image is decoded once
+            jobs_by_page = defaultdict(list)
+            for job_index, job in enumerate(crop_jobs):
+                jobs_by_page[job[0].get('page_number', 1)].append((job_index, job))
             
-            # Extract images for titles
-            for title_item in title:
-                if title_item.get('bounding_box'):
-                    image_data = self._crop_image_from_bounding_box(
-                        title_item['bounding_box'], title_item['text'], "title", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
+            # Crops are encoded and written to temporary files in the background while later pages are cropped
+            save_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+            pending_crops = {}
             
-            # Extract images for dates
-            for date_item in date:
-                if date_item.get('bounding_box'):
-                    image_data = self._crop_image_from_bounding_box(
-                        date_item['bounding_box'], date_item['text'], "date", 
-                        page_image_map, job_output_dir, image_count, file_path
-                    )
-                    if image_data:
-                        extracted_images.append(image_data)
-                        image_count += 1
+            for page_number, page_jobs in jobs_by_page.items():
+                if page_number not in page_image_map:
+                    logger.warning(f"Page {page_number} image not found for cropping {len(page_jobs)} field(s)")
+                    continue
+                
+                # Decode the page image once, converted to RGB for better quality
+                with Image.open(page_image_map[page_number]) as source_image:
+                    page_arr = np.asarray(source_image.convert('RGB'))
+                
+                # Convert every box on this page to pixel coordinates in one pass
+                boxes = np.array(
+                    [[bbox.get('x', 0), bbox.get('y', 0), bbox.get('width', 0), bbox.get('height', 0)]
+                     for _, (bbox, _, _) in page_jobs],
+                    dtype=np.float64
+                )
+                page_height, page_width = page_arr.shape[:2]
+                crop_boxes = _pixel_crop_boxes(boxes, [field_type for _, (_, _, field_type) in page_jobs], (page_width, page_height))
+                
+                for (job_index, job), crop_box in zip(page_jobs, crop_boxes.tolist()):
+                    temp_path = job_output_dir / f".crop_{job_index}.png"
+                    save_future = self._crop_one(page_arr, job, crop_box, temp_path, save_executor)
+                    if save_future is not None:
+                        pending_crops[job_index] = (page_number, temp_path, save_future)
+            
+            save_executor.shutdown(wait=True)
+            
+            # Number the images in field order, independent of page grouping, counting only crops that were saved
+            for job_index in sorted(pending_crops):
+                page_number, temp_path, save_future = pending_crops[job_index]
+                bounding_box, description, field_type = crop_jobs[job_index]
+                error = save_future.exception()
+                if error is not None:
+                    logger.error(f"Error cropping image for {field_type}: {str(error)}")
+                    temp_path.unlink(missing_ok=True)
+                    continue
+                
+                image_number = len(extracted_images) + 1
+                image_filename = f"entity_{field_type.lower().replace('_', '')}_{image_number}.png"
+                os.replace(temp_path, job_output_dir / image_filename)
+                
+                extracted_images.append(ImageData(
+                    image_id=f"{field_type}_image_{image_number}",
+                    page_number=page_number,
+                    bounding_box=bounding_box,
+                    image_type=f"entity_{field_type.lower()}",
+                    description=description,
+                    confidence=1.0,  # High confidence since we're cropping from detected entities
+                    file_path=job_output_dir.name + os.sep + image_filename
+                ))
+                logger.debug("Extracted high-quality image for {}: {}", field_type, description)
             
             logger.info(f"Extracted {len(extracted_images)} images for engineering fields")
             
@@ -1628,101 +1706,39 @@ class DocumentAIProcessor:
         
         return extracted_images
     
-    def _crop_image_from_bounding_box(self, bounding_box, description, field_type, page_image_map, job_output_dir, image_count, file_path, page_number=None):
+    def _crop_one(self, page_arr, crop_job, crop_box, image_path, save_executor):
         """
-        Crop an image from a page based on bounding box coordinates with high resolution.
+        Crop a single field bounding box out of an already decoded page image.
+        
+        Args:
+            page_arr: Decoded RGB page image as a (height, width, 3) array
+            crop_job: Tuple of (bounding_box, description, field_type)
+            crop_box: Padded pixel box ``[x1, y1, x2, y2, buffer]`` from _pixel_crop_boxes
+            image_path: Path (Path) the cropped image is written to
+            save_executor: Executor the PNG encode and write is submitted to
+            
+        Returns:
+            Future of the background save, or None if the crop failed
         """
+        bounding_box, description, field_type = crop_job
         try:
-            from PIL import Image, ImageEnhance
-            
-            # Get page number from parameter or fallback to default
-            if page_number is None:
-                page_number = bounding_box.get('page_number', 1)
-                logger.warning(f"Page number not provided for {field_type}, using fallback: {page_number}")
-            
-            if page_number not in page_image_map:
-                logger.warning(f"Page {page_number} image not found for cropping")
-                return None
-            
-            # Open the page image with high quality
-            page_image_path = page_image_map[page_number]
-            page_image = Image.open(page_image_path)
-            
-            # Convert to RGB if necessary for better quality
-            if page_image.mode != 'RGB':
-                page_image = page_image.convert('RGB')
-            
-            # Get bounding box coordinates (these are normalized coordinates 0-1)
-            x_norm = bounding_box.get('x', 0)
-            y_norm = bounding_box.get('y', 0)
-            width_norm = bounding_box.get('width', 0)
-            height_norm = bounding_box.get('height', 0)
-            
-            # Get the page dimensions from the image
-            img_width, img_height = page_image.size
-            
-            logger.info(f"Normalized bounding box: x={x_norm:.6f}, y={y_norm:.6f}, width={width_norm:.6f}, height={height_norm:.6f}")
-            logger.info(f"Page image dimensions: {img_width}x{img_height}")
-            
-            # Convert normalized coordinates (0-1) to pixel coordinates
-            # crop method needs (x1, y1, x2, y2) where (x1, y1) is top-left and (x2, y2) is bottom-right
-            x1 = int(x_norm * img_width)
-            y1 = int(y_norm * img_height)
-            x2 = int((x_norm + width_norm) * img_width)
-            y2 = int((y_norm + height_norm) * img_height)
-            
-            logger.info(f"Pixel coordinates: x1={x1}, y1={y1}, x2={x2}, y2={y2}")
-            
-            # Ensure coordinates are within image bounds
-            x1 = max(0, x1)
-            y1 = max(0, y1)
-            x2 = min(img_width, x2)
-            y2 = min(img_height, y2)
-            
-            logger.info(f"Bounded coordinates: x1={x1}, y1={y1}, x2={x2}, y2={y2}")
-            
-            # Add adaptive buffer around the crop area based on content size and entity type
-            # Calculate buffer based on normalized content size
-            content_size_norm = width_norm * height_norm
-            
-            # Entity-specific buffer strategies (in pixels)
-            if field_type in ['drawing_title', 'drawing_number', 'date']:
-                # These are usually small, precise elements - minimal buffer
-                buffer_pixels = 5
-            elif field_type in ['design_criteria']:
-                # Design criteria can be longer text - moderate buffer
-                buffer_pixels = 10
-            elif content_size_norm < 0.001:  # Very small content
-                buffer_pixels = 15
-            elif content_size_norm < 0.01:  # Small content
-                buffer_pixels = 12
-            else:  # Large content
-                buffer_pixels = 8
-            
-            logger.info(f"Content size (normalized): {content_size_norm:.6f}, Buffer: {buffer_pixels} pixels")
-            
-            # Apply buffer with bounds checking
-            x1 = max(0, x1 - buffer_pixels)
-            y1 = max(0, y1 - buffer_pixels)
-            x2 = min(img_width, x2 + buffer_pixels)
-            y2 = min(img_height, y2 + buffer_pixels)
-            
-            logger.info(f"Final crop coordinates with buffer: x1={x1}, y1={y1}, x2={x2}, y2={y2}")
+            x1, y1, x2, y2, buffer_pixels = crop_box
+            page_height, page_width = page_arr.shape[:2]
             
             # Ensure valid crop dimensions
             if x2 <= x1 or y2 <= y1:
                 logger.warning(f"Invalid crop dimensions for {field_type}: x1={x1}, y1={y1}, x2={x2}, y2={y2}")
-                logger.warning(f"Normalized bounding box: x={x_norm:.6f}, y={y_norm:.6f}, width={width_norm:.6f}, height={height_norm:.6f}")
-                logger.warning(f"Page image size: {page_image.size}")
+                logger.warning(f"Normalized bounding box: {bounding_box}")
+                logger.warning(f"Page image size: {page_width}x{page_height}")
                 return None
             
-            # Log successful crop dimensions
-            logger.info(f"Successfully calculated crop dimensions for {field_type}: x1={x1}, y1={y1}, x2={x2}, y2={y2}")
-            logger.info(f"Normalized bounding box: x={x_norm:.6f}, y={y_norm:.6f}, width={width_norm:.6f}, height={height_norm:.6f}")
-            logger.info(f"Page image size: {page_image.size}")
+            logger.debug(
+                "Cropping {} on {}x{} page: normalized {} -> pixels ({}, {}, {}, {}), buffer {}",
+                field_type, page_width, page_height, bounding_box, x1, y1, x2, y2, buffer_pixels
+            )
             
-            # Crop the image
-            cropped_image = page_image.crop((x1, y1, x2, y2))
+            # Crop by slicing the decoded page; PIL only sees the cropped region
+            cropped_image = Image.fromarray(page_arr[y1:y2, x1:x2])
             
             # Enhance image quality
             # Increase sharpness slightly
@@ -1733,150 +1749,116 @@ class DocumentAIProcessor:
             enhancer = ImageEnhance.Contrast(cropped_image)
             cropped_image = enhancer.enhance(1.1)
             
-            # Save the cropped image with high quality
-            safe_description = "".join(c for c in description if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            safe_description = safe_description.replace(' ', '_')[:30]  # Limit length
-            image_filename = f"entity_{field_type.lower().replace('_', '')}_{image_count + 1}.png"
-            image_path = os.path.join(job_output_dir, image_filename)
-            
-            # Save with high quality settings
-            cropped_image.save(image_path, 'PNG', optimize=False, quality=95)
-            
-            # Create ImageData object
-            image_data = ImageData(
-                image_id=f"{field_type}_image_{image_count + 1}",
-                page_number=page_number,
-                bounding_box=bounding_box,
-                image_type=f"entity_{field_type.lower()}",
-                description=description,
-                confidence=1.0,  # High confidence since we're cropping from detected entities
-                file_path=os.path.join(os.path.basename(job_output_dir), image_filename)
-            )
-            
-            logger.info(f"Extracted high-quality image for {field_type}: {description}")
-            return image_data
+            # Save the cropped image with high quality, encoding and writing in the background
+            return save_executor.submit(_save_png, cropped_image, image_path)
             
         except Exception as e:
             logger.error(f"Error cropping image for {field_type}: {str(e)}")
             return None
     
-    def _parse_loads(self, doc_ai_response: DocumentAIResponse) -> List[LoadSpecification]:
-        """Parse loads from Document AI entities using exact field names."""
-        loads = []
-        
-        for entity in doc_ai_response.entities:
-            # Use exact field names from Document AI configuration
-            if entity.type in ["BERTHING_LOADS", "MOORING_LOADS", "VERTICAL_DEAD_LOADS", "VERTICAL_LIVE_LOADS", "WIND_LOADS"]:
-                # Map entity type to load type
-                load_type_map = {
-                    "BERTHING_LOADS": LoadType.OTHER,
-                    "MOORING_LOADS": LoadType.OTHER,
-                    "VERTICAL_DEAD_LOADS": LoadType.DEAD_LOAD,
-                    "VERTICAL_LIVE_LOADS": LoadType.LIVE_LOAD,
-                    "WIND_LOADS": LoadType.WIND_LOAD
-                }
-                
-                # Extract load information from entity
-                load = LoadSpecification(
-                    load_type=load_type_map.get(entity.type, LoadType.OTHER),
-                    magnitude=0.0,  # Extract from text
-                    unit="",  # Extract from text
-                    description=entity.mention_text,
-                    confidence=entity.confidence,
-                    bounding_box=entity.bounding_box
-                )
-                loads.append(load)
-                logger.info(f"Extracted load: {entity.type} - {entity.mention_text[:50]}...")
+    def _parse_entity_dispatched(self, doc_ai_response: DocumentAIResponse) -> Tuple[List[LoadSpecification], List[SeismicForce], List[DesignVehicle], List[DesignCrane]]:
+        """
+        Parse loads, seismic forces, design vehicles and design cranes in a single pass over the entities.
         
-        return loads
-    
-    def _parse_seismic_forces(self, doc_ai_response: DocumentAIResponse) -> List[SeismicForce]:
-        """Parse seismic forces from Document AI entities using exact field names."""
-        seismic_forces = []
+        Args:
+            doc_ai_response: Processed Document AI response
+            
+        Returns:
+            Tuple of (loads, seismic_forces, design_vehicles, design_cranes), each in entity order
+        """
+        parsed = {
+            'loads': [],
+            'seismic_forces': [],
+            'design_vehicles': [],
+            'design_cranes': [],
+        }
+        
+        # Use exact field names from Document AI configuration
+        dispatch = dict.fromkeys(_LOAD_TYPES, self._build_load)
+        dispatch.update({
+            "SEISMIC_FORCES": self._build_seismic,
+            "DESIGN_VEHICLE": self._build_vehicle,
+            "DESIGN_CRANE": self._build_crane,
+            "DESIGN_CRITERIA": self._build_from_criteria,
+        })
         
         for entity in doc_ai_response.entities:
-            # Use exact field name from Document AI configuration
-            if entity.type == "SEISMIC_FORCES":
-                seismic_force = SeismicForce(
-                    unit="",  # Extract from text
-                    description=entity.mention_text,
-                    confidence=entity.confidence,
-                    bounding_box=entity.bounding_box
-                )
-                seismic_forces.append(seismic_force)
-                logger.info(f"Extracted seismic force: {entity.mention_text[:50]}...")
+            handler = dispatch.get(entity.type)
+            if handler is not None:
+                handler(entity, parsed)
         
-        return seismic_forces
+        return parsed['loads'], parsed['seismic_forces'], parsed['design_vehicles'], parsed['design_cranes']
     
-    def _parse_design_vehicles(self, doc_ai_response: DocumentAIResponse) -> List[DesignVehicle]:
-        """Parse design vehicles from Document AI entities using exact field names."""
-        vehicles = []
-        
-        for entity in doc_ai_response.entities:
-            # Check for DESIGN_VEHICLE entity or extract from DESIGN_CRITERIA
-            if entity.type == "DESIGN_VEHICLE":
-                vehicle = DesignVehicle(
-                    vehicle_type=VehicleType.OTHER,
-                    unit="",  # Extract from text
-                    description=entity.mention_text,
-                    confidence=entity.confidence,
-                    bounding_box=entity.bounding_box
-                )
-                vehicles.append(vehicle)
-                logger.info(f"Extracted design vehicle: {entity.mention_text[:50]}...")
-            elif entity.type == "DESIGN_CRITERIA" and "DESIGN VEHICLE:" in entity.mention_text:
-                # Extract design vehicle from DESIGN_CRITERIA text
-                text = entity.mention_text
-                if "DESIGN VEHICLE:" in text:
-                    # Extract the design vehicle information
-                    vehicle_info = text.split("DESIGN VEHICLE:")[1].split("DESIGN CRANE:")[0].strip()
-                    vehicle = DesignVehicle(
-                        vehicle_type=VehicleType.OTHER,
-                        unit="",  # Extract from text
-                        description=vehicle_info,
-                        confidence=entity.confidence,
-                        bounding_box=entity.bounding_box
-                    )
-                    vehicles.append(vehicle)
-                    logger.info(f"Extracted design vehicle from DESIGN_CRITERIA: {vehicle_info[:50]}...")
-        
-        return vehicles
+    def _build_load(self, entity, parsed: Dict[str, list]):
+        """Add a load specification for a *_LOADS entity."""
+        load = LoadSpecification(
+            load_type=_LOAD_TYPE_MAP.get(entity.type, LoadType.OTHER),
+            magnitude=0.0,  # Extract from text
+            unit="",  # Extract from text
+            description=entity.mention_text,
+            confidence=entity.confidence,
+            bounding_box=entity.bounding_box
+        )
+        parsed['loads'].append(load)
+        logger.info(f"Extracted load: {entity.type} - {entity.mention_text[:50]}...")
     
-    def _parse_design_cranes(self, doc_ai_response: DocumentAIResponse) -> List[DesignCrane]:
-        """Parse design cranes from Document AI entities using exact field names."""
-        cranes = []
-        
-        for entity in doc_ai_response.entities:
-            # Check for DESIGN_CRANE entity or extract from DESIGN_CRITERIA
-            if entity.type == "DESIGN_CRANE":
-                crane = DesignCrane(
-                    crane_type=CraneType.OTHER,
-                    capacity=0.0,  # Extract from text
-                    unit="",  # Extract from text
-                    description=entity.mention_text,
-                    confidence=entity.confidence,
-                    bounding_box=entity.bounding_box
-                )
-                cranes.append(crane)
-                logger.info(f"Extracted design crane: {entity.mention_text[:50]}...")
-            elif entity.type == "DESIGN_CRITERIA" and "DESIGN CRANE:" in entity.mention_text:
-                # Extract design crane from DESIGN_CRITERIA text
-                text = entity.mention_text
-                if "DESIGN CRANE:" in text:
-                    # Extract the design crane information
-                    crane_info = text.split("DESIGN CRANE:")[1].split("DYNAMIC LOAD ALLOWAN")[0].strip()
-                    crane = DesignCrane(
-                        crane_type=CraneType.OTHER,
-                        capacity=0.0,  # Extract from text
-                        unit="",  # Extract from text
-                        description=crane_info,
-                        confidence=entity.confidence,
-                        bounding_box=entity.bounding_box
-                    )
-                    cranes.append(crane)
-                    logger.info(f"Extracted design crane from DESIGN_CRITERIA: {crane_info[:50]}...")
-        
-        return cranes
+    def _build_seismic(self, entity, parsed: Dict[str, list]):
+        """Add a seismic force for a SEISMIC_FORCES entity."""
+        seismic_force = SeismicForce(
+            unit="",  # Extract from text
+            description=entity.mention_text,
+            confidence=entity.confidence,
+            bounding_box=entity.bounding_box
+        )
+        parsed['seismic_forces'].append(seismic_force)
+        logger.info(f"Extracted seismic force: {entity.mention_text[:50]}...")
+    
+    def _build_vehicle(self, entity, parsed: Dict[str, list], description: Optional[str] = None):
+        """Add a design vehicle for a DESIGN_VEHICLE entity, or from DESIGN_CRITERIA text."""
+        vehicle = DesignVehicle(
+            vehicle_type=VehicleType.OTHER,
+            unit="",  # Extract from text
+            description=entity.mention_text if description is None else description,
+            confidence=entity.confidence,
+            bounding_box=entity.bounding_box
+        )
+        parsed['design_vehicles'].append(vehicle)
+        if description is None:
+            logger.info(f"Extracted design vehicle: {entity.mention_text[:50]}...")
+        else:
+            logger.info(f"Extracted design vehicle from DESIGN_CRITERIA: {description[:50]}...")
+    
+    def _build_crane(self, entity, parsed: Dict[str, list], description: Optional[str] = None):
+        """Add a design crane for a DESIGN_CRANE entity, or from DESIGN_CRITERIA text."""
+        crane = DesignCrane(
+            crane_type=CraneType.OTHER,
+            capacity=0.0,  # Extract from text
+            unit="",  # Extract from text
+            description=entity.mention_text if description is None else description,
+            confidence=entity.confidence,
+            bounding_box=entity.bounding_box
+        )
+        parsed['design_cranes'].append(crane)
+        if description is None:
+            logger.info(f"Extracted design crane: {entity.mention_text[:50]}...")
+        else:
+            logger.info(f"Extracted design crane from DESIGN_CRITERIA: {description[:50]}...")
+    
+    def _build_from_criteria(self, entity, parsed: Dict[str, list]):
+        """Add the design vehicle and design crane embedded in a DESIGN_CRITERIA entity's text."""
+        text = entity.mention_text
+        
+        # Extract the design vehicle information
+        _, found, rest = text.partition("DESIGN VEHICLE:")
+        if found:
+            vehicle_info, _, _ = rest.partition("DESIGN CRANE:")
+            self._build_vehicle(entity, parsed, vehicle_info.strip())
+        
+        # Extract the design crane information
+        _, found, rest = text.partition("DESIGN CRANE:")
+        if found:
+            crane_info, _, _ = rest.partition("DYNAMIC LOAD ALLOWAN")
+            self._build_crane(entity, parsed, crane_info.strip())
     
     def _parse_tables(self, doc_ai_response: DocumentAIResponse) -> List[TableData]:
         """Parse tables from Document AI response."""
@@ -1900,35 +1882,20 @@ class DocumentAIProcessor:
         images = []
         
         # If we have real extracted images, use those instead of Document AI placeholders
-        if extracted_image_files and len(extracted_image_files) > 0:
-            for i, image_path in enumerate(extracted_image_files):
-                # Extract page number from filename (e.g., pdf_image_1_2.png -> page 1)
-                filename = os.path.basename(image_path)
-                page_number = 1  # default
-                
-                # Parse page number from filename
-                if filename.startswith('pdf_image_'):
-                    try:
-                        parts = filename.replace('.png', '').split('_')
-                        if len(parts) >= 3:
-                            page_number = int(parts[2])
-                    except:
-                        pass
-                
-                image_data = ImageData(
+        if extracted_image_files:
+            # Page number comes from the filename (e.g., pdf_image_1_2.png -> page 1)
+            page_matches = [_PDF_IMG_RE.match(os.path.basename(image_path)) for image_path in extracted_image_files]
+            images = [
+                ImageData(
                     image_id=f"pdf_image_{i+1}",
-                    page_number=page_number,
+                    page_number=int(match.group(1)) if match else 1,
                     bounding_box=None,  # We don't have bounding box info from PDF extraction
-                    confidence=1.0  # High confidence since these are real extracted images
+                    confidence=1.0,  # High confidence since these are real extracted images
+                    # Store relative path from data/extracted_images/
+                    file_path=image_path.replace('data/extracted_images/', '') if image_path.startswith('data/extracted_images/') else image_path
                 )
-                
-                # Store relative path from data/extracted_images/
-                if image_path.startswith('data/extracted_images/'):
-                    image_data.file_path = image_path.replace('data/extracted_images/', '')
-                else:
-                    image_data.file_path = image_path
-                
-                images.append(image_data)
+                for i, (image_path, match) in enumerate(zip(extracted_image_files, page_matches))
+            ]
         else:
             # Fall back to Document AI images if no real images were extracted
             for i, image in enumerate(doc_ai_response.images):
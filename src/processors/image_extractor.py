@@ -5,8 +5,9 @@ Extracts images from Document AI processed documents.
 
 import os
 import json
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 
 try:
@@ -15,12 +16,41 @@ except ImportError:
     logger.warning("Document AI Toolbox not available. Install with: pip install google-cloud-documentai-toolbox")
     document = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Parse-event prefixes of a page image (a single object or an array of them),
+# and of its bounding box fields relative to that image
+_IMAGE_PREFIXES = frozenset(('pages.item.image', 'pages.item.image.item'))
+_VERTEX_KEYS = frozenset(('layout.boundingPoly.vertices.item', 'layout.bounding_poly.vertices.item'))
+_VERTEX_COORDS = {f'{vertex_key}.{axis}': axis for vertex_key in _VERTEX_KEYS for axis in ('x', 'y')}
+
 
 class ImageExtractor:
     """
     Extract images from Document AI processed documents using the Document AI Toolbox.
     """
     
+    # Number of parsed documents kept in memory
+    DOC_CACHE_SIZE = 4
+    
+    # Directories already created by any instance in this process
+    _dirs_created = set()
+    
+    @classmethod
+    def _ensure_dir(cls, path: str):
+        """Create a directory once per process instead of on every call."""
+        if path not in cls._dirs_created:
+            os.makedirs(path, exist_ok=True)
+            cls._dirs_created.add(path)
+    
     def __init__(self, output_dir: str = "data/extracted_images"):
         """
         Initialize the image extractor.
@@ -29,7 +59,11 @@ class ImageExtractor:
             output_dir: Directory to save extracted images
         """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
+        
+        # Parsed Toolbox documents keyed by (path, mtime), so one file is only parsed once
+        self._doc_cache: Dict[Tuple[str, float], Any] = {}
+        self._doc_cache_lock = threading.Lock()
         
         if document is None:
             raise ImportError("Document AI Toolbox is required. Install with: pip install google-cloud-documentai-toolbox")
@@ -52,30 +86,70 @@ class ImageExtractor:
             List of paths to extracted image files
         """
         try:
-            # Create job-specific output directory
-            job_output_dir = os.path.join(self.output_dir, job_id)
-            os.makedirs(job_output_dir, exist_ok=True)
-            
             # Load document using Document AI Toolbox
-            wrapped_document = document.Document.from_document_path(document_path=document_path)
+            wrapped_document = self._load_document(document_path)
             
-            # Extract images using Document AI Toolbox (following the official example)
-            output_files = wrapped_document.export_images(
-                output_path=job_output_dir,
-                output_file_prefix=output_file_prefix,
-                output_file_extension=output_file_extension,
-            )
-            
-            logger.info("Images Successfully Exported")
-            for output_file in output_files:
-                logger.info(f"Extracted image: {output_file}")
-            
-            return output_files
+            return self._export_images(wrapped_document, job_id, output_file_prefix, output_file_extension)
             
         except Exception as e:
             logger.error(f"Error extracting images from {document_path}: {str(e)}")
             return []
     
+    def _load_document(self, document_path: str):
+        """
+        Load a Document AI JSON file with the Toolbox, reusing the parsed document if the file is unchanged.
+        
+        Args:
+            document_path: Path to the Document AI JSON response file
+            
+        Returns:
+            Wrapped Document AI Toolbox document
+        """
+        cache_key = (os.path.abspath(document_path), os.stat(document_path).st_mtime)
+        wrapped_document = self._doc_cache.get(cache_key)
+        if wrapped_document is None:
+            wrapped_document = document.Document.from_document_path(document_path=document_path)
+            with self._doc_cache_lock:
+                while len(self._doc_cache) >= self.DOC_CACHE_SIZE:
+                    # Drop the oldest entry
+                    self._doc_cache.pop(next(iter(self._doc_cache)))
+                self._doc_cache[cache_key] = wrapped_document
+        return wrapped_document
+    
+    def _export_images(self,
+                       wrapped_document,
+                       job_id: str,
+                       output_file_prefix: str = "image",
+                       output_file_extension: str = "png") -> List[str]:
+        """
+        Export the images of an already loaded document into the job's output directory.
+        
+        Args:
+            wrapped_document: Wrapped Document AI Toolbox document
+            job_id: Unique job identifier for organizing output
+            output_file_prefix: Prefix for extracted image files
+            output_file_extension: File extension for extracted images
+            
+        Returns:
+            List of paths to extracted image files
+        """
+        # Create job-specific output directory
+        job_output_dir = os.path.join(self.output_dir, job_id)
+        self._ensure_dir(job_output_dir)
+        
+        # Extract images using Document AI Toolbox (following the official example)
+        output_files = wrapped_document.export_images(
+            output_path=job_output_dir,
+            output_file_prefix=output_file_prefix,
+            output_file_extension=output_file_extension,
+        )
+        
+        logger.info(f"Images Successfully Exported: {len(output_files)} images to {job_output_dir}")
+        for output_file in output_files:
+            logger.debug("Extracted image: {}", output_file)
+        
+        return output_files
+    
     def extract_images_from_json_response(self, 
                                         doc_ai_response: Dict[str, Any], 
                                         job_id: str,
@@ -96,12 +170,17 @@ class ImageExtractor:
         try:
             # Create job-specific output directory
             job_output_dir = os.path.join(self.output_dir, job_id)
-            os.makedirs(job_output_dir, exist_ok=True)
+            self._ensure_dir(job_output_dir)
             
             # Save response to temporary file
             temp_doc_path = os.path.join(job_output_dir, "temp_document.json")
-            with open(temp_doc_path, 'w') as f:
-                json.dump(doc_ai_response, f)
+            if orjson is not None:
+                # Serialize straight to bytes and write them in one call
+                with open(temp_doc_path, 'wb') as f:
+                    f.write(orjson.dumps(doc_ai_response))
+            else:
+                with open(temp_doc_path, 'w') as f:
+                    json.dump(doc_ai_response, f)
             
             # Extract images
             output_files = self.extract_images_from_document(
@@ -111,11 +190,15 @@ class ImageExtractor:
                 output_file_extension=output_file_extension
             )
             
-            # Clean up temporary file
+            # Clean up temporary file and its parsed copy
             try:
                 os.remove(temp_doc_path)
             except:
                 pass
+            temp_abspath = os.path.abspath(temp_doc_path)
+            with self._doc_cache_lock:
+                for cache_key in [key for key in self._doc_cache if key[0] == temp_abspath]:
+                    del self._doc_cache[cache_key]
             
             return output_files
             
@@ -123,18 +206,30 @@ class ImageExtractor:
             logger.error(f"Error extracting images from JSON response: {str(e)}")
             return []
     
-    def get_image_metadata(self, document_path: str) -> List[Dict[str, Any]]:
+    def get_image_metadata(self, document_path: str, wrapped_document=None) -> List[Dict[str, Any]]:
         """
         Get metadata about images in the document without extracting them.
         
+        Pages are streamed from the JSON file with ijson when it is installed, so the
+        whole response never has to be loaded into memory at once. An already loaded
+        document is read directly instead.
+        
         Args:
             document_path: Path to the Document AI JSON response file
+            wrapped_document: Optional Toolbox document already loaded from document_path
             
         Returns:
             List of image metadata dictionaries
         """
+        if ijson is not None and wrapped_document is None:
+            try:
+                return self._stream_image_metadata(document_path)
+            except Exception as e:
+                logger.warning(f"Streaming image metadata from {document_path} failed, falling back to Document AI Toolbox: {str(e)}")
+        
         try:
-            wrapped_document = document.Document.from_document_path(document_path=document_path)
+            if wrapped_document is None:
+                wrapped_document = self._load_document(document_path)
             
             image_metadata = []
             for page_num, page in enumerate(wrapped_document.pages):
@@ -164,6 +259,95 @@ class ImageExtractor:
             logger.error(f"Error getting image metadata from {document_path}: {str(e)}")
             return []
     
+    def _stream_image_metadata(self, document_path: str) -> List[Dict[str, Any]]:
+        """
+        Collect image metadata by streaming parse events out of a Document AI JSON file.
+        
+        Only image layouts are assembled; page tokens, text and base64 image content are
+        passed over without building Python objects for them.
+        
+        Args:
+            document_path: Path to the Document AI JSON response file
+            
+        Returns:
+            List of image metadata dictionaries, in the same shape as get_image_metadata
+        """
+        image_metadata = []
+        page_number = 0
+        image_index = 0
+        image_prefix = None
+        image = None
+        
+        with open(document_path, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if event == 'start_map':
+                    if prefix == 'pages.item':
+                        page_number += 1
+                        image_index = 0
+                    elif prefix in _IMAGE_PREFIXES:
+                        image_prefix = prefix
+                        image = {'confidence': 0.0, 'vertices': [], 'mime_type': None}
+                    elif image is not None and prefix[len(image_prefix) + 1:] in _VERTEX_KEYS:
+                        image['vertices'].append({})
+                    continue
+                
+                if image is None:
+                    continue
+                
+                if event == 'end_map' and prefix == image_prefix:
+                    metadata = self._image_metadata_entry(page_number, image_index, image)
+                    if metadata is not None:
+                        image_metadata.append(metadata)
+                    image_index += 1
+                    image = None
+                    continue
+                
+                key = prefix[len(image_prefix) + 1:]
+                if key in _VERTEX_COORDS and image['vertices']:
+                    image['vertices'][-1][_VERTEX_COORDS[key]] = value
+                elif key == 'layout.confidence':
+                    image['confidence'] = value
+                elif key in ('mimeType', 'mime_type'):
+                    image['mime_type'] = value
+        
+        return image_metadata
+    
+    @staticmethod
+    def _image_metadata_entry(page_number: int, image_index: int, image: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Build one metadata entry from the fields collected by _stream_image_metadata.
+        
+        Args:
+            page_number: 1-based page number
+            image_index: Index of the image on its page
+            image: Collected confidence, vertices and MIME type
+            
+        Returns:
+            Image metadata dictionary, or None if the image has no usable bounding box
+        """
+        vertices = image['vertices']
+        if len(vertices) < 3:
+            return None
+        
+        top_left, bottom_right = vertices[0], vertices[2]
+        metadata = {
+            'page_number': page_number,
+            'image_index': image_index,
+            'confidence': image['confidence'],
+            'bounding_box': {
+                'x': top_left.get('x', 0),
+                'y': top_left.get('y', 0),
+                'width': bottom_right.get('x', 0) - top_left.get('x', 0),
+                'height': bottom_right.get('y', 0) - top_left.get('y', 0)
+            }
+        }
+        
+        # Add MIME type if available
+        if image['mime_type']:
+            metadata['mime_type'] = image['mime_type']
+        
+        return metadata
+    
     def extract_images_with_metadata(self, 
                                    document_path: str, 
                                    job_id: str,
@@ -182,16 +366,23 @@ class ImageExtractor:
             Dictionary containing extracted file paths and metadata
         """
         try:
+            # Parse the document once for both metadata and extraction
+            try:
+                wrapped_document = self._load_document(document_path)
+            except Exception as e:
+                logger.error(f"Error loading document {document_path}: {str(e)}")
+                wrapped_document = None
+            
             # Get image metadata first
-            metadata = self.get_image_metadata(document_path)
+            metadata = self.get_image_metadata(document_path, wrapped_document=wrapped_document)
             
             # Extract images
-            output_files = self.extract_images_from_document(
-                document_path=document_path,
-                job_id=job_id,
-                output_file_prefix=output_file_prefix,
-                output_file_extension=output_file_extension
-            )
+            output_files = []
+            if wrapped_document is not None:
+                try:
+                    output_files = self._export_images(wrapped_document, job_id, output_file_prefix, output_file_extension)
+                except Exception as e:
+                    logger.error(f"Error extracting images from {document_path}: {str(e)}")
             
             # Combine metadata with file paths
             result = {
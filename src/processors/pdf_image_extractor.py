@@ -4,30 +4,508 @@ when Document AI doesn't provide actual image data.
 """
 
 import os
+import io
+import json
+import mmap
+import time
+import shutil
+import tempfile
+import hashlib
+import functools
+import threading
+import multiprocessing
 import fitz  # PyMuPDF
+import numpy as np
 from PIL import Image
-import io
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 
+# Optional: BLAKE3 hashes several times faster than SHA-256 for cache fingerprints
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+def _fingerprint(path: str) -> str:
+    """
+    Content hash of a file, used to key the extraction cache.
+    
+    Memoized on the file's path, modification time and size, so repeated calls
+    for an unchanged file do not read it again.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        Hex digest of the file contents
+    """
+    stat = os.stat(path)
+    return _fingerprint_file(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _fingerprint_file(path: str, mtime_ns: int, size: int) -> str:
+    """Hash a memory-mapped file with BLAKE3 when available, otherwise SHA-256."""
+    with open(path, 'rb') as f:
+        if size == 0:
+            data = b''
+        else:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if blake3 is not None:
+                return blake3.blake3(data, max_threads=blake3.blake3.AUTO).hexdigest()
+            return hashlib.sha256(data).hexdigest()
+        finally:
+            if size:
+                data.close()
+
+
+def _link_or_copy(src: str, dst: str):
+    """
+    Hard-link src to dst, copying instead when linking is not possible.
+    
+    An existing dst is replaced. If another job creates dst at the same time its file
+    is kept, and copies are renamed into place so dst is never seen half-written.
+    """
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        pass
+    except OSError:
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(dst) or '.', suffix='.tmp')
+        os.close(fd)
+        try:
+            shutil.copy2(src, temp_path)
+            os.replace(temp_path, dst)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+
+def _dir_size(path: str) -> int:
+    """Total size in bytes of the files directly inside a directory."""
+    with os.scandir(path) as entries:
+        return sum(entry.stat().st_size for entry in entries if entry.is_file())
+
+
+def _ensure_rgb(pix):
+    """
+    Return the pixmap as 3-channel RGB without alpha.
+    
+    Already-RGB pixmaps, such as page renders with alpha=False, are returned as-is
+    without allocating a copy.
+    """
+    if pix.alpha:
+        pix = fitz.Pixmap(pix, 0)
+    if pix.colorspace is None or pix.colorspace.n != 3:
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    return pix
+
+
+def _pixmap_png_bytes(pix) -> bytes:
+    """
+    Encode a pixmap as RGB PNG bytes, the way extracted images have always been saved.
+    
+    MuPDF's PNG output is re-saved by Pillow with its default settings, so the size
+    checked against min_file_size does not depend on which optional encoders are
+    installed. Pixmaps MuPDF cannot write as PNG are converted to RGB first.
+    """
+    try:
+        png_bytes = pix.tobytes("png")
+    except Exception:
+        png_bytes = _ensure_rgb(pix).tobytes("png")
+    pil_image = Image.open(io.BytesIO(png_bytes))
+    if pil_image.mode != 'RGB':
+        pil_image = pil_image.convert('RGB')
+    buffer = io.BytesIO()
+    pil_image.save(buffer, format='PNG', optimize=False)
+    return buffer.getvalue()
+
+
+def _write_bytes(path: str, data: bytes):
+    """Write a file in one call, replacing rather than writing through an existing file."""
+    # The path may be a hard link into the extraction cache
+    if os.path.exists(path):
+        os.remove(path)
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _save_page_png(samples: bytes, width: int, height: int, stride: int, path: str):
+    """
+    Save raw RGB page samples as PNG; safe to call from worker threads.
+    
+    Takes plain bytes copied out of the pixmap by the rendering thread, because
+    MuPDF objects must not be touched from other threads. Pillow releases the GIL
+    while compressing, so several pages can be encoded in parallel.
+    """
+    # The path may be a hard link into the extraction cache
+    if os.path.exists(path):
+        os.remove(path)
+    
+    page_image = Image.frombuffer('RGB', (width, height), samples, 'raw', 'RGB', stride, 1)
+    # Page renders are intermediates for cropping; favour encode speed over size
+    page_image.save(path, format='PNG', compress_level=1, optimize=False)
+
+
+def _page_dpi(page, dpi: int, target_max_px: Optional[int]) -> float:
+    """Rendering DPI for a page, capped so its longest side stays within target_max_px."""
+    if target_max_px:
+        return min(dpi, target_max_px * 72 / max(page.rect.width, page.rect.height))
+    return dpi
+
+
+def _raw_stream_length(pdf_document, xref: int) -> int:
+    """
+    Compressed length of an image stream, read from its /Length key without decoding.
+    
+    Falls back to reading the raw stream when /Length is an indirect reference.
+    """
+    value_type, value = pdf_document.xref_get_key(xref, "Length")
+    if value_type == "int":
+        return int(value)
+    return len(pdf_document.xref_stream_raw(xref) or b"")
+
+
+def _extract_page_images(pdf_path: str, page_num: int, job_output_dir: str, min_width: int, min_height: int, min_file_size: int, skip_xrefs: frozenset = frozenset(), keep_jpeg: bool = False) -> Tuple[List[str], int, int]:
+    """
+    Extract the meaningful embedded images of a single PDF page.
+    
+    Module-level so it can run in a worker process; the PDF is reopened here
+    because PyMuPDF documents cannot be pickled.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        page_num: 0-based page index
+        job_output_dir: Directory extracted images are written to
+        min_width: Minimum width in pixels for meaningful images
+        min_height: Minimum height in pixels for meaningful images
+        min_file_size: Minimum file size in bytes for meaningful images
+        skip_xrefs: Image xrefs already handled on an earlier page
+        keep_jpeg: Write JPEG-encoded images as their original .jpg bytes instead of converting to PNG
+        
+    Returns:
+        Tuple of (extracted image paths in image order, number of images on the page,
+        total bytes written)
+    """
+    extracted_files = []
+    extracted_bytes = 0
+    
+    # Loop invariants and lookups hoisted out of the per-image loop
+    page_label = page_num + 1
+    min_stream_size = min_file_size // 4
+    min_jpeg_size = min_file_size // 2
+    join_path = os.path.join
+    log_debug = logger.debug
+    
+    with fitz.open(pdf_path) as pdf_document:
+        page = pdf_document[page_num]
+        
+        # Get image list from page
+        image_list = page.get_images()
+        
+        for img_index, img in enumerate(image_list):
+            image_number = img_index + 1
+            try:
+                # Get image dimensions from PDF metadata
+                img_width = img[2]
+                img_height = img[3]
+                
+                # Skip very small images (likely icons, logos, etc.)
+                if img_width < min_width or img_height < min_height:
+                    log_debug("Skipping small image {} from page {}: {}x{}", image_number, page_label, img_width, img_height)
+                    continue
+                
+                # Images shared across pages (logos, headers) are only extracted on their first page
+                xref = img[0]
+                if xref in skip_xrefs:
+                    log_debug("Skipping repeated image {} (xref {}) on page {}", image_number, xref, page_label)
+                    continue
+                
+                # Skip streams too small to ever produce a meaningful file, before decoding them
+                raw_len = _raw_stream_length(pdf_document, xref)
+                if raw_len < min_stream_size:
+                    log_debug("Skipping small stream image {} from page {}: {} bytes", image_number, page_label, raw_len)
+                    continue
+                
+                # RGB or grayscale JPEG streams are written as-is, with no decode or re-encode
+                jpeg_info = pdf_document.extract_image(xref) if keep_jpeg and img[8] == "DCTDecode" else None
+                if jpeg_info and jpeg_info["ext"] == "jpeg" and jpeg_info["colorspace"] in (1, 3):
+                    jpeg_bytes = jpeg_info["image"]
+                    # JPEG is more compact than the equivalent PNG, so halve the size threshold
+                    if len(jpeg_bytes) < min_jpeg_size:
+                        log_debug("Skipping small file size image {} from page {}: {} bytes", image_number, page_label, len(jpeg_bytes))
+                        continue
+                    
+                    image_path = join_path(job_output_dir, f"pdf_image_{page_label}_{image_number}.jpg")
+                    _write_bytes(image_path, jpeg_bytes)
+                    extracted_files.append(image_path)
+                    extracted_bytes += len(jpeg_bytes)
+                    log_debug("Extracted meaningful image {} from page {}: {}x{}, {} bytes (original JPEG)", image_number, page_label, img_width, img_height, len(jpeg_bytes))
+                    continue
+                
+                # Get image data
+                pix = fitz.Pixmap(pdf_document, xref)
+                
+                # Check actual image dimensions
+                actual_width, actual_height = pix.width, pix.height
+                
+                # Skip if actual dimensions are too small
+                if actual_width < min_width or actual_height < min_height:
+                    log_debug("Skipping small actual image {} from page {}: {}x{}", image_number, page_label, actual_width, actual_height)
+                    pix = None
+                    continue
+                
+                # Encode in memory and check file size before anything touches the disk
+                png_bytes = _pixmap_png_bytes(pix)
+                file_size = len(png_bytes)
+                if file_size < min_file_size:
+                    log_debug("Skipping small file size image {} from page {}: {} bytes", image_number, page_label, file_size)
+                    pix = None
+                    continue
+                
+                image_filename = f"pdf_image_{page_label}_{image_number}.png"
+                image_path = join_path(job_output_dir, image_filename)
+                _write_bytes(image_path, png_bytes)
+                
+                extracted_files.append(image_path)
+                extracted_bytes += file_size
+                
+                log_debug("Extracted meaningful image {} from page {}: {}x{}, {} bytes", image_number, page_label, actual_width, actual_height, file_size)
+                
+                # Clean up
+                pix = None
+                
+            except Exception as e:
+                logger.warning(f"Failed to extract image {img_index} from page {page_num + 1}: {str(e)}")
+                continue
+    
+    return extracted_files, len(image_list), extracted_bytes
+
+
+# Smaller PDFs are extracted in-process; worker start-up and pickling cost more than they save
+PARALLEL_MIN_PAGES = 4
+PARALLEL_MIN_IMAGES = 16
+
+# Worker processes shared by every extractor in this process, created on first use
+_page_pool = None
+_page_pool_lock = threading.Lock()
+
+
+def _init_page_worker():
+    """Keep MuPDF's own warnings out of worker stderr; only affects the worker process."""
+    fitz.TOOLS.mupdf_display_errors(False)
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared worker pool for per-page image extraction.
+    
+    A single pool sized to the CPU count bounds the number of worker processes however
+    many threads extract at once. Workers are spawned rather than forked, since the
+    callers are usually multi-threaded.
+    """
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is None:
+            _page_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                             mp_context=multiprocessing.get_context("spawn"),
+                                             initializer=_init_page_worker)
+        return _page_pool
+
+
+def _discard_page_pool(pool: ProcessPoolExecutor):
+    """Drop a broken worker pool so the next caller starts a fresh one."""
+    global _page_pool
+    with _page_pool_lock:
+        if _page_pool is pool:
+            _page_pool = None
+    pool.shutdown(wait=False)
+
 
 class PDFImageExtractor:
     """Extract images directly from PDF files using PyMuPDF."""
     
-    def __init__(self, output_dir: str = "data/extracted_images"):
+    # Directories already created by any instance in this process
+    _dirs_created = set()
+    
+    @classmethod
+    def _ensure_dir(cls, path: str):
+        """Create a directory once per process instead of on every call."""
+        if path not in cls._dirs_created:
+            os.makedirs(path, exist_ok=True)
+            cls._dirs_created.add(path)
+    
+    # Image cache limits, overridable with IMAGE_CACHE_MAX_MB and IMAGE_CACHE_MAX_AGE_DAYS
+    CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+    CACHE_MAX_AGE = 30 * 24 * 60 * 60
+    
+    # Page renders are held in memory until encoded: a 300 DPI A1 page is about 200 MB of RGB,
+    # so only a few encoder threads run and rendering waits once this many bytes are queued
+    PAGE_ENCODE_WORKERS = 2
+    PAGE_ENCODE_MAX_BYTES = 256 * 1024 * 1024
+    
+    def __init__(self, output_dir: str = "data/extracted_images", max_workers: Optional[int] = None, cache_dir: Optional[str] = None):
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
+        # Upper bound on threads for one extraction; 1 also keeps image extraction out of the worker pool
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Previously extracted images, keyed by PDF content hash and extraction settings.
+        # Kept next to output_dir rather than inside it, since output_dir is served to clients.
+        self.cache_dir = (cache_dir or os.getenv("IMAGE_CACHE_DIR")
+                          or os.path.join(os.path.dirname(os.path.abspath(output_dir)), "image_cache"))
+        max_mb = os.getenv("IMAGE_CACHE_MAX_MB")
+        self.cache_max_bytes = int(max_mb) * 1024 * 1024 if max_mb else self.CACHE_MAX_BYTES
+        max_age_days = os.getenv("IMAGE_CACHE_MAX_AGE_DAYS")
+        self.cache_max_age = float(max_age_days) * 24 * 60 * 60 if max_age_days else self.CACHE_MAX_AGE
+        self._ensure_dir(output_dir)
+    
+    def _cache_entry_dir(self, pdf_path: str, kind: str, params: Tuple) -> str:
+        """Cache directory for one PDF and one set of extraction settings."""
+        settings = "_".join(str(p) for p in params)
+        return os.path.join(self.cache_dir, _fingerprint(pdf_path), f"{kind}_{settings}")
+    
+    def _load_cached(self, cache_entry_dir: str, job_output_dir: str) -> Optional[List[str]]:
+        """
+        Link the files of a cache entry into a job directory.
+        
+        Args:
+            cache_entry_dir: Cache directory returned by _cache_entry_dir
+            job_output_dir: Job directory the files are linked into
+            
+        Returns:
+            Job file paths in extraction order, or None on a cache miss
+        """
+        manifest_path = os.path.join(cache_entry_dir, "manifest.json")
+        if not os.path.exists(manifest_path):
+            return None
+        
+        try:
+            with open(manifest_path, 'r') as f:
+                filenames = json.load(f)
+            
+            self._ensure_dir(job_output_dir)
+            job_files = []
+            for filename in filenames:
+                job_path = os.path.join(job_output_dir, filename)
+                _link_or_copy(os.path.join(cache_entry_dir, filename), job_path)
+                job_files.append(job_path)
+            # The manifest's modification time marks when the entry was last used
+            os.utime(manifest_path)
+            return job_files
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable image cache entry {cache_entry_dir}: {str(e)}")
+            return None
+    
+    def _store_cached(self, cache_entry_dir: str, files: List[str]):
+        """
+        Record extracted files in a cache entry; the manifest is written last so partial entries are never used.
+        
+        Args:
+            cache_entry_dir: Cache directory returned by _cache_entry_dir
+            files: Extracted file paths in extraction order
+        """
+        try:
+            # Not _ensure_dir: evicted entries have to be created again
+            os.makedirs(cache_entry_dir, exist_ok=True)
+            filenames = []
+            for file_path in files:
+                filename = os.path.basename(file_path)
+                cache_path = os.path.join(cache_entry_dir, filename)
+                # Files already there came from an identical extraction by another job
+                if not os.path.exists(cache_path):
+                    _link_or_copy(file_path, cache_path)
+                filenames.append(filename)
+            
+            fd, temp_path = tempfile.mkstemp(dir=cache_entry_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(filenames, f)
+                os.replace(temp_path, os.path.join(cache_entry_dir, "manifest.json"))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not cache extracted images in {cache_entry_dir}: {str(e)}")
+            return
+        
+        self._evict_cached(keep=cache_entry_dir)
+    
+    def _evict_cached(self, keep: Optional[str] = None):
+        """
+        Remove cache entries unused for longer than the maximum age, then the least recently
+        used entries until the cache fits its size limit.
+        
+        Args:
+            keep: Cache entry directory that is never removed
+        """
+        try:
+            entries = []
+            with os.scandir(self.cache_dir) as fingerprint_dirs:
+                for fingerprint_dir in fingerprint_dirs:
+                    if not fingerprint_dir.is_dir():
+                        continue
+                    with os.scandir(fingerprint_dir.path) as entry_dirs:
+                        for entry_dir in entry_dirs:
+                            if not entry_dir.is_dir():
+                                continue
+                            try:
+                                last_used = os.stat(os.path.join(entry_dir.path, "manifest.json")).st_mtime
+                            except FileNotFoundError:
+                                # Being written by another job, or left behind by a failed one
+                                last_used = entry_dir.stat().st_mtime
+                            entries.append((last_used, _dir_size(entry_dir.path), entry_dir.path))
+        except OSError as e:
+            logger.warning(f"Could not scan image cache {self.cache_dir}: {str(e)}")
+            return
+        
+        entries.sort()
+        total_bytes = sum(size for _, size, _ in entries)
+        oldest_allowed = time.time() - self.cache_max_age
+        removed = 0
+        for last_used, size, path in entries:
+            if last_used >= oldest_allowed and total_bytes <= self.cache_max_bytes:
+                break
+            if path == keep:
+                continue
+            # Drop the manifest first so the entry stops being used before its files go
+            try:
+                os.remove(os.path.join(path, "manifest.json"))
+            except OSError:
+                pass
+            shutil.rmtree(path, ignore_errors=True)
+            try:
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass
+            total_bytes -= size
+            removed += 1
+        
+        if removed:
+            logger.info(f"Evicted {removed} image cache entries, {total_bytes // (1024 * 1024)} MB remain")
     
-    def extract_images_from_pdf(self, pdf_path: str, job_id: str, min_width: int = 100, min_height: int = 100, min_file_size: int = 5000) -> List[str]:
+    def extract_images_from_pdf(self, pdf_path: str, job_id: str, min_width: int = 100, min_height: int = 100, min_file_size: int = 5000, keep_jpeg: bool = False) -> List[str]:
         """
         Extract meaningful images directly from PDF file.
         
+        Pages of larger PDFs are processed in a shared pool of worker processes, unless
+        this is already running in a worker process.
+        Results are cached on disk, so extracting an identical PDF again only links the files.
+        
         Args:
             pdf_path: Path to the PDF file
             job_id: Job identifier for organizing output
             min_width: Minimum width in pixels for meaningful images
             min_height: Minimum height in pixels for meaningful images
             min_file_size: Minimum file size in bytes for meaningful images
+            keep_jpeg: Write JPEG-encoded images as their original .jpg bytes instead of converting to PNG
             
         Returns:
             List of paths to extracted image files
@@ -37,86 +515,55 @@ class PDFImageExtractor:
         try:
             # Create job-specific output directory
             job_output_dir = os.path.join(self.output_dir, job_id)
-            os.makedirs(job_output_dir, exist_ok=True)
+            self._ensure_dir(job_output_dir)
             
-            # Open PDF with PyMuPDF
-            pdf_document = fitz.open(pdf_path)
+            logger.info(f"Extracting images from {pdf_path} (fingerprint {_fingerprint(pdf_path)[:12]})")
+            cache_entry_dir = self._cache_entry_dir(pdf_path, "images", (min_width, min_height, min_file_size, keep_jpeg))
+            cached_files = self._load_cached(cache_entry_dir, job_output_dir)
+            if cached_files is not None:
+                logger.info(f"Reused {len(cached_files)} cached images for {pdf_path}")
+                return cached_files
             
-            image_count = 0
-            meaningful_count = 0
+            # Find images repeated across pages so each xref is only decoded once
+            page_args = []
+            seen_xrefs = set()
+            with fitz.open(pdf_path) as pdf_document:
+                page_count = pdf_document.page_count
+                for page_num in range(page_count):
+                    page_xrefs = [img[0] for img in pdf_document.get_page_images(page_num)]
+                    skip_xrefs = frozenset(xref for xref in page_xrefs if xref in seen_xrefs)
+                    seen_xrefs.update(page_xrefs)
+                    page_args.append((pdf_path, page_num, job_output_dir, min_width, min_height, min_file_size, skip_xrefs, keep_jpeg))
             
-            for page_num in range(len(pdf_document)):
-                page = pdf_document[page_num]
-                
-                # Get image list from page
-                image_list = page.get_images()
-                
-                for img_index, img in enumerate(image_list):
-                    try:
-                        # Get image dimensions from PDF metadata
-                        img_width = img[2]
-                        img_height = img[3]
-                        
-                        # Skip very small images (likely icons, logos, etc.)
-                        if img_width < min_width or img_height < min_height:
-                            logger.debug(f"Skipping small image {img_index + 1} from page {page_num + 1}: {img_width}x{img_height}")
-                            continue
-                        
-                        # Get image data
-                        xref = img[0]
-                        pix = fitz.Pixmap(pdf_document, xref)
-                        
-                        # Convert to PIL Image
-                        img_data = pix.tobytes("png")
-                        pil_image = Image.open(io.BytesIO(img_data))
-                        
-                        # Check actual image dimensions
-                        actual_width, actual_height = pil_image.size
-                        
-                        # Skip if actual dimensions are too small
-                        if actual_width < min_width or actual_height < min_height:
-                            logger.debug(f"Skipping small actual image {img_index + 1} from page {page_num + 1}: {actual_width}x{actual_height}")
-                            pix = None
-                            continue
-                        
-                        # Convert to RGB if necessary for better quality
-                        if pil_image.mode != 'RGB':
-                            pil_image = pil_image.convert('RGB')
-                        
-                        # Save image temporarily to check file size with high quality
-                        temp_path = os.path.join(job_output_dir, f"temp_{page_num + 1}_{img_index + 1}.png")
-                        pil_image.save(temp_path, 'PNG', optimize=False, quality=95)
-                        
-                        # Check file size
-                        file_size = os.path.getsize(temp_path)
-                        if file_size < min_file_size:
-                            logger.debug(f"Skipping small file size image {img_index + 1} from page {page_num + 1}: {file_size} bytes")
-                            os.remove(temp_path)
-                            pix = None
-                            continue
-                        
-                        # Rename to final filename
-                        image_filename = f"pdf_image_{page_num + 1}_{img_index + 1}.png"
-                        image_path = os.path.join(job_output_dir, image_filename)
-                        os.rename(temp_path, image_path)
-                        
-                        extracted_files.append(image_path)
-                        meaningful_count += 1
-                        
-                        logger.info(f"Extracted meaningful image {meaningful_count} from page {page_num + 1}: {actual_width}x{actual_height}, {file_size} bytes")
-                        
-                        # Clean up
-                        pix = None
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to extract image {img_index} from page {page_num + 1}: {str(e)}")
-                        continue
-                
-                image_count += len(image_list)
+            page_results = {}
+            use_pool = (self.max_workers > 1
+                        and page_count >= PARALLEL_MIN_PAGES
+                        and len(seen_xrefs) >= PARALLEL_MIN_IMAGES
+                        and multiprocessing.parent_process() is None)
+            if use_pool:
+                executor = _get_page_pool()
+                try:
+                    futures = {executor.submit(_extract_page_images, *args): args[1] for args in page_args}
+                    for future in as_completed(futures):
+                        page_results[futures[future]] = future.result()
+                except BrokenProcessPool as e:
+                    logger.warning(f"Image extraction worker pool failed, continuing in-process: {str(e)}")
+                    _discard_page_pool(executor)
+            for args in page_args:
+                if args[1] not in page_results:
+                    page_results[args[1]] = _extract_page_images(*args)
             
-            pdf_document.close()
+            # Merge in page order so output is identical to a sequential run
+            image_count = 0
+            extracted_bytes = 0
+            for page_num in range(page_count):
+                page_files, page_image_count, page_bytes = page_results[page_num]
+                extracted_files.extend(page_files)
+                image_count += page_image_count
+                extracted_bytes += page_bytes
+            meaningful_count = len(extracted_files)
             
-            logger.info(f"Found {image_count} total images, extracted {meaningful_count} meaningful images from PDF")
+            logger.info(f"Found {image_count} total images on {page_count} pages, extracted {meaningful_count} meaningful images ({extracted_bytes // 1024} KB) from PDF")
             
             # If no meaningful images found, try extracting full pages as images
             if meaningful_count == 0:
@@ -124,20 +571,27 @@ class PDFImageExtractor:
                 page_images = self.extract_pages_as_images(pdf_path, job_id)
                 extracted_files.extend(page_images)
             
+            if extracted_files:
+                self._store_cached(cache_entry_dir, extracted_files)
+            
             return extracted_files
             
         except Exception as e:
             logger.error(f"Error extracting images from PDF {pdf_path}: {str(e)}")
             return []
     
-    def extract_pages_as_images(self, pdf_path: str, job_id: str, dpi: int = 300) -> List[str]:
+    def extract_pages_as_images(self, pdf_path: str, job_id: str, dpi: int = 300, target_max_px: Optional[int] = None) -> List[str]:
         """
         Extract full pages as images from PDF file with high resolution.
         
+        Results are cached on disk, so rendering an identical PDF again only links the files.
+        
         Args:
             pdf_path: Path to the PDF file
             job_id: Job identifier for organizing output
             dpi: Resolution for page rendering (default: 300 for high quality)
+            target_max_px: Longest side of a rendered page in pixels; large pages are
+                rendered below dpi to stay within it; opt-in for previews (default None always renders at dpi)
             
         Returns:
             List of paths to extracted page images
@@ -147,52 +601,111 @@ class PDFImageExtractor:
         try:
             # Create job-specific output directory
             job_output_dir = os.path.join(self.output_dir, job_id)
-            os.makedirs(job_output_dir, exist_ok=True)
+            self._ensure_dir(job_output_dir)
+            
+            cache_entry_dir = self._cache_entry_dir(pdf_path, "pages", (dpi, target_max_px))
+            cached_files = self._load_cached(cache_entry_dir, job_output_dir)
+            if cached_files is not None:
+                logger.info(f"Reused {len(cached_files)} cached page images for {pdf_path}")
+                return cached_files
             
             # Open PDF with PyMuPDF
             pdf_document = fitz.open(pdf_path)
+            page_count = pdf_document.page_count
             
-            for page_num in range(len(pdf_document)):
-                page = pdf_document[page_num]
-                
-                # Create transformation matrix for high DPI rendering
-                # Use higher DPI for better quality
-                mat = fitz.Matrix(dpi/72, dpi/72)  # 72 is the default DPI
-                
-                # Render page to pixmap with high quality
-                pix = page.get_pixmap(matrix=mat, alpha=False)
-                
-                # Convert to PIL Image
-                img_data = pix.tobytes("png")
-                pil_image = Image.open(io.BytesIO(img_data))
-                
-                # Convert to RGB if necessary for better quality
-                if pil_image.mode != 'RGB':
-                    pil_image = pil_image.convert('RGB')
+            # Pages are rendered here one at a time and their copied samples PNG-encoded
+            # on worker threads, with at most PAGE_ENCODE_MAX_BYTES of samples waiting or being
+            # encoded (always at least one page)
+            with ThreadPoolExecutor(max_workers=min(self.PAGE_ENCODE_WORKERS, self.max_workers)) as encode_executor:
+                pending_encodes = deque()
+                pending_bytes = 0
                 
-                # Save page image with high quality
-                page_filename = f"page_{page_num + 1}.png"
-                page_path = os.path.join(job_output_dir, page_filename)
+                for page_num in range(page_count):
+                    page = pdf_document[page_num]
+                    
+                    # Create transformation matrix for high DPI rendering,
+                    # capped so the longest side stays within target_max_px
+                    page_dpi = _page_dpi(page, dpi, target_max_px)
+                    mat = fitz.Matrix(page_dpi/72, page_dpi/72)  # 72 is the default DPI
+                    
+                    # Render page to an RGB pixmap with high quality
+                    pix = _ensure_rgb(page.get_pixmap(matrix=mat, alpha=False))
+                    
+                    # Wait for earlier pages before copying this one if that would exceed the budget
+                    page_bytes = pix.stride * pix.height
+                    while pending_encodes and pending_bytes + page_bytes > self.PAGE_ENCODE_MAX_BYTES:
+                        encode, encode_bytes = pending_encodes.popleft()
+                        encode.result()
+                        pending_bytes -= encode_bytes
+                    
+                    # Hand the encoder plain bytes; MuPDF is only used from this thread
+                    page_filename = f"page_{page_num + 1}.png"
+                    page_path = os.path.join(job_output_dir, page_filename)
+                    pending_encodes.append((encode_executor.submit(
+                        _save_page_png, bytes(pix.samples), pix.width, pix.height, pix.stride, page_path
+                    ), page_bytes))
+                    pending_bytes += page_bytes
+                    
+                    extracted_files.append(page_path)
+                    
+                    logger.debug("Extracted high-quality page {} as image: {}x{} at {:.0f} DPI", page_num + 1, pix.width, pix.height, page_dpi)
+                    
+                    # Clean up
+                    pix = None
                 
-                # Save with high quality settings
-                pil_image.save(page_path, 'PNG', optimize=False, quality=95)
-                
-                extracted_files.append(page_path)
-                
-                logger.info(f"Extracted high-quality page {page_num + 1} as image: {pil_image.size[0]}x{pil_image.size[1]} at {dpi} DPI")
-                
-                # Clean up
-                pix = None
+                for encode, _ in pending_encodes:
+                    encode.result()
             
             pdf_document.close()
             
-            logger.info(f"Successfully extracted {len(extracted_files)} pages as high-quality images at {dpi} DPI")
+            if extracted_files:
+                self._store_cached(cache_entry_dir, extracted_files)
+            
+            logger.info(f"Successfully extracted {len(extracted_files)} pages as high-quality images at up to {dpi} DPI")
             return extracted_files
             
         except Exception as e:
             logger.error(f"Error extracting pages as images from PDF {pdf_path}: {str(e)}")
             return []
     
+    def extract_pages_as_arrays(self, pdf_path: str, dpi: int = 300, target_max_px: Optional[int] = None) -> List[np.ndarray]:
+        """
+        Render full pages as RGB arrays without encoding them to image files.
+        
+        For consumers that work on pixels directly, this skips the PNG encode and
+        the decode that would follow it.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            dpi: Resolution for page rendering (default: 300 for high quality)
+            target_max_px: Longest side of a rendered page in pixels; large pages are
+                rendered below dpi to stay within it; opt-in for previews (default None always renders at dpi)
+            
+        Returns:
+            List of (height, width, 3) uint8 arrays, in page order
+        """
+        page_arrays = []
+        
+        try:
+            with fitz.open(pdf_path) as pdf_document:
+                for page in pdf_document:
+                    page_dpi = _page_dpi(page, dpi, target_max_px)
+                    mat = fitz.Matrix(page_dpi/72, page_dpi/72)
+                    pix = page.get_pixmap(matrix=mat, alpha=False)
+                    
+                    pix = _ensure_rgb(pix)
+                    
+                    # Copy out of the pixmap's buffer so the pixmap can be freed
+                    page_arrays.append(np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width, pix.n).copy())
+                    pix = None
+            
+            logger.info(f"Rendered {len(page_arrays)} pages as arrays at up to {dpi} DPI")
+            return page_arrays
+            
+        except Exception as e:
+            logger.error(f"Error rendering pages as arrays from PDF {pdf_path}: {str(e)}")
+            return []
+    
     def get_image_info(self, pdf_path: str) -> List[Dict[str, Any]]:
         """
         Get information about images in PDF without extracting them.
@@ -208,7 +721,7 @@ class PDFImageExtractor:
         try:
             pdf_document = fitz.open(pdf_path)
             
-            for page_num in range(len(pdf_document)):
+            for page_num in range(pdf_document.page_count):
                 page = pdf_document[page_num]
                 image_list = page.get_images()
                 
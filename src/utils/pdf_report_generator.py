@@ -4,31 +4,354 @@ Generates comprehensive PDF reports with extracted fields, entity text, and imag
 """
 
 import os
+import io
+import copy
 from datetime import datetime
+from html import escape
 from typing import Dict, List, Any, Optional
-from reportlab.lib.pagesizes import letter, A4
+from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch, cm
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image as RLImage, PageBreak, Table, TableStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
-from reportlab.lib.colors import blue, black, grey, white, lightgrey
+from reportlab.lib.enums import TA_CENTER
 from reportlab.lib import colors
+from reportlab.lib.utils import ImageReader
 from PIL import Image
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Extracted field types shown in reports, and their display names
+_FIELD_TYPES = (
+    'berthing_loads', 'date', 'design_criteria', 'design_loads',
+    'drawing_number', 'drawing_title', 'mooring_loads',
+    'vertical_dead_loads', 'vertical_live_loads', 'wind_loads'
+)
+_FIELD_DISPLAY = {field_type: field_type.replace('_', ' ').title() for field_type in _FIELD_TYPES}
+
+# Maximum (width, height) in points for images in each kind of section
+_FIELD_IMAGE_BOUNDS = (4 * inch, 3 * inch)
+_ENTITY_IMAGE_BOUNDS = (5 * inch, 4 * inch)
+_EXTRACTED_IMAGE_BOUNDS = (6 * inch, 4 * inch)
+
+# Minimum number of images to resize before a thread pool is worth starting
+_PARALLEL_RESIZE_MIN_IMAGES = 4
+
+# Table styles are invariant, so they are built once and shared by every table
+_METADATA_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+# Bordered image-and-caption table used for entity images
+_ENTITY_IMAGE_TABLE_STYLE = TableStyle([
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('GRID', (0, 0), (-1, -1), 3, colors.black),  # Thicker black border
+    ('BACKGROUND', (0, 0), (0, 0), colors.lightgrey),  # Light background for image
+    ('BACKGROUND', (0, 1), (0, 1), colors.white),     # White background for caption
+    ('LEFTPADDING', (0, 0), (-1, -1), 15),   # Increased padding
+    ('RIGHTPADDING', (0, 0), (-1, -1), 15),  # Increased padding
+    ('TOPPADDING', (0, 0), (0, 0), 15),     # Image cell top padding
+    ('BOTTOMPADDING', (0, 0), (0, 0), 10),  # Image cell bottom padding
+    ('TOPPADDING', (0, 1), (0, 1), 8),      # Caption cell top padding
+    ('BOTTOMPADDING', (0, 1), (0, 1), 15),  # Caption cell bottom padding
+    ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.lightgrey, colors.white]),
+])
+
+
+class _ReaderImage(RLImage):
+    """Image flowable drawn from an already loaded ImageReader, so its raster is decoded once."""
+    
+    def __init__(self, reader: ImageReader, width: float, height: float):
+        self._img = reader
+        super().__init__(reader.fp, width=width, height=height)
+
 
 class EngineeringPDFReportGenerator:
     """Generate comprehensive PDF reports for engineering document extraction results."""
     
+    # Stylesheet shared by all generators; styles are never modified after setup
+    _shared_styles = None
+    
+    # Parsed paragraphs for fixed labels by (text, style name); templates are copied, never placed in a story
+    _static_paragraphs: Dict[tuple, Paragraph] = {}
+    
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        if EngineeringPDFReportGenerator._shared_styles is None:
+            self.styles = getSampleStyleSheet()
+            self._setup_custom_styles()
+            EngineeringPDFReportGenerator._shared_styles = self.styles
+        self.styles = EngineeringPDFReportGenerator._shared_styles
+        
+        # Image dimensions and existence checks by path; images are probed from several sections
+        self._size_cache: Dict[str, tuple] = {}
+        self._exists_cache: Dict[str, bool] = {}
+        self._job_files: Dict[str, set] = {}
+        self._scaled_cache: Dict[tuple, tuple] = {}
+        
+        # Downscaled encodings of large images by (path, target pixel size)
+        self._resized_cache: Dict[tuple, tuple] = {}
+        self._reader_cache: Dict[tuple, ImageReader] = {}
+        
+        # Result images indexed by lower-cased image_type, plus their lower-cased match fields
+        self._indexed_images = None
+        self._image_index: Dict[str, List[Dict]] = {}
+        self._image_meta: List[tuple] = []
+    
+    def _index_images(self, images: List[Dict]):
+        """
+        Index result images for matching, once per images list.
+        
+        Args:
+            images: Image dictionaries from the extraction results
+        """
+        if self._indexed_images is images:
+            return
+        
+        self._image_index = {}
+        self._image_meta = []
+        for image in images:
+            image_type = image.get('image_type', '').lower()
+            self._image_meta.append((image, image_type, image.get('file_path', '').lower(), image.get('description', '').lower()))
+            self._image_index.setdefault(image_type, []).append(image)
+        self._indexed_images = images
+    
+    def _clear_image_index(self):
+        """Drop the image index and directory listings built for a report."""
+        self._indexed_images = None
+        self._image_index = {}
+        self._image_meta = []
+        self._job_files = {}
+    
+    def _path_exists(self, path: str) -> bool:
+        """Check whether a file exists, remembering the answer for this generator."""
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            exists = self._exists_cache[path] = os.path.exists(path)
+        return exists
+    
+    def _list_job_files(self, job_dir: str) -> set:
+        """
+        List the file names in a job's image directory, reading the directory only once per report.
+        
+        Args:
+            job_dir: Directory holding the job's images
+            
+        Returns:
+            Set of file names; empty if the directory does not exist
+        """
+        names = self._job_files.get(job_dir)
+        if names is None:
+            try:
+                with os.scandir(job_dir) as entries:
+                    names = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                names = set()
+            self._job_files[job_dir] = names
+        return names
+    
+    def _probe_size(self, path: str) -> tuple:
+        """
+        Get an image's pixel dimensions, opening the file only the first time.
+        
+        Image.open only parses the header, so no pixel data is decoded.
+        
+        Args:
+            path: Path to the image file
+            
+        Returns:
+            Tuple of (width, height) in pixels
+        """
+        size = self._size_cache.get(path)
+        if size is None:
+            with Image.open(path) as img:
+                size = self._size_cache[path] = img.size
+        return size
+    
+    def _static_paragraph(self, text: str, style_name: str) -> Paragraph:
+        """
+        Get a paragraph for fixed label text, parsing its markup only the first time.
+        
+        A shallow copy of a cached template is returned because platypus records layout
+        state on each flowable, so one Paragraph cannot appear twice in a story.
+        
+        Args:
+            text: Label markup that never varies
+            style_name: Name of the style in the shared stylesheet
+            
+        Returns:
+            Paragraph flowable
+        """
+        key = (text, style_name)
+        template = self._static_paragraphs.get(key)
+        if template is None:
+            template = self._static_paragraphs[key] = Paragraph(text, self.styles[style_name])
+        return copy.copy(template)
+    
+    @staticmethod
+    def _pct(value: float) -> str:
+        """Format a 0-1 confidence value as a percentage."""
+        return f"{value * 100:.1f}%"
+    
+    @staticmethod
+    def _fit(img_width: float, img_height: float, max_width: float, max_height: float) -> tuple:
+        """Scale dimensions down to fit within bounds, preserving aspect ratio and never enlarging."""
+        scale = min(max_width / img_width, max_height / img_height, 1.0)
+        return img_width * scale, img_height * scale
+    
+    def _fitted_size(self, path: str, max_width: float, max_height: float) -> tuple:
+        """
+        Get the display size of an image fitted within bounds, computed once per image and bounds.
+        
+        Args:
+            path: Path to the image file
+            max_width: Maximum display width in points
+            max_height: Maximum display height in points
+            
+        Returns:
+            Tuple of (width, height) in points
+        """
+        key = (path, max_width, max_height)
+        fitted = self._scaled_cache.get(key)
+        if fitted is None:
+            fitted = self._scaled_cache[key] = self._fit(*self._probe_size(path), max_width, max_height)
+        return fitted
+    
+    def _image_flowable(self, path: str, width: float, height: float) -> RLImage:
+        """
+        Create an image flowable, embedding a downscaled copy when the source is much larger than displayed.
+        
+        Images are resampled to twice their display size in points and the encoded result
+        is cached, so an image used in several sections is only resized once. A fresh
+        flowable is returned on every call, sharing one ImageReader per resized image so
+        ReportLab decodes its raster only once however often it is drawn.
+        
+        Args:
+            path: Path to the image file
+            width: Display width in points
+            height: Display height in points
+            
+        Returns:
+            ReportLab image flowable
+        """
+        target_size = self._resize_target(path, width, height)
+        if target_size is None:
+            return RLImage(path, width=width, height=height)
+        
+        key = (path, target_size)
+        reader = self._reader_cache.get(key)
+        if reader is None:
+            resized = self._resized_cache.get(key)
+            if resized is None:
+                resized = self._resized_cache[key] = self._resize_to_bytes(path, target_size)
+            reader = self._reader_cache[key] = ImageReader(io.BytesIO(resized))
+        
+        return _ReaderImage(reader, width, height)
+    
+    def _resize_target(self, path: str, width: float, height: float) -> Optional[tuple]:
+        """Get the pixel size to downscale an image to for a display size, or None if it is small enough."""
+        target_size = (max(1, int(width * 2)), max(1, int(height * 2)))
+        img_width, img_height = self._probe_size(path)
+        if img_width <= target_size[0] and img_height <= target_size[1]:
+            return None
+        return target_size
+    
+    @staticmethod
+    def _resize_to_bytes(path: str, target_size: tuple) -> bytes:
+        """
+        Downscale an image to fit a pixel size and encode it.
+        
+        Args:
+            path: Path to the image file
+            target_size: Maximum (width, height) in pixels
+            
+        Returns:
+            Encoded image bytes; JPEG sources stay JPEG, everything else becomes PNG
+        """
+        with Image.open(path) as img:
+            image_format = 'JPEG' if img.format == 'JPEG' else 'PNG'
+            if image_format == 'JPEG':
+                # Let libjpeg decode at the smallest 1/2, 1/4 or 1/8 scale still covering the target;
+                # thumbnail() alone keeps twice the target size before resampling
+                img.draft('RGB', target_size)
+            img.thumbnail(target_size, Image.LANCZOS)
+            buffer = io.BytesIO()
+            img.save(buffer, format=image_format, quality=90)
+        return buffer.getvalue()
+    
+    def _preresize_images(self, images: List[Dict], image_base_path: str, bounds: tuple):
+        """
+        Downscale oversized result images in parallel before the report is laid out.
+        
+        PIL releases the GIL while decoding, resampling and encoding, so a thread pool
+        resizes several images at once. The results land in the resize cache, which the
+        report sections then read instead of resizing one image at a time. Small reports
+        and single-core hosts skip the pool and resize lazily as before.
+        
+        Args:
+            images: Image dictionaries from the extraction results
+            image_base_path: Base path the image file paths are relative to
+            bounds: Maximum (width, height) display size in points
+        """
+        if not images or not image_base_path or (os.cpu_count() or 1) < 2:
+            return
+        
+        keys = []
+        for image in images:
+            file_path = image.get('file_path')
+            if not file_path:
+                continue
+            path = os.path.join(image_base_path, file_path)
+            try:
+                if not self._path_exists(path):
+                    continue
+                target_size = self._resize_target(path, *self._fitted_size(path, *bounds))
+            except Exception as e:
+                logger.debug(f"Skipping pre-resize of {path}: {str(e)}")
+                continue
+            key = (path, target_size)
+            if target_size is not None and key not in self._resized_cache and key not in keys:
+                keys.append(key)
+        
+        if len(keys) < _PARALLEL_RESIZE_MIN_IMAGES:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(len(keys), os.cpu_count())) as executor:
+            futures = [executor.submit(self._resize_to_bytes, *key) for key in keys]
+            for key, future in zip(keys, futures):
+                try:
+                    self._resized_cache[key] = future.result()
+                except Exception as e:
+                    # Leave it to the section to retry and report the failure
+                    logger.debug(f"Could not pre-resize {key[0]}: {str(e)}")
+        logger.info(f"Pre-resized {len(keys)} report images")
     
     def _setup_custom_styles(self):
         """Setup custom paragraph styles for the report."""
+        # Styles can only be added to a stylesheet once
+        if 'ReportTitle' in self.styles:
+            return
+        
         # Title style
         self.styles.add(ParagraphStyle(
             name='ReportTitle',
@@ -117,6 +440,19 @@ class EngineeringPDFReportGenerator:
             
             story = []
             
+            # Index result images once for all entity lookups
+            self._index_images(design_criteria.get('images', []))
+            
+            # Downscale the images the entities section will embed up front, several at a time
+            entities = design_criteria.get('document_ai_entities', [])
+            if entities and image_base_path:
+                entity_images = {}
+                for entity in entities:
+                    match = self._best_entity_image(entity.get('type', 'Unknown'))
+                    if match is not None:
+                        entity_images[id(match[0])] = match[0]
+                self._preresize_images(list(entity_images.values()), image_base_path, _ENTITY_IMAGE_BOUNDS)
+            
             # Add Document AI entities section only (no title, metadata, or summary)
             self._add_entities_section(story, design_criteria, image_base_path, job_id)
             
@@ -128,10 +464,12 @@ class EngineeringPDFReportGenerator:
         except Exception as e:
             logger.error(f"Error generating PDF report: {str(e)}")
             return False
+        finally:
+            self._clear_image_index()
     
     def _add_title_section(self, story: List, design_criteria: Dict[str, Any]):
         """Add title and header information."""
-        story.append(Paragraph("Engineering Design Criteria Extraction Report", self.styles['ReportTitle']))
+        story.append(self._static_paragraph("Engineering Design Criteria Extraction Report", 'ReportTitle'))
         story.append(Spacer(1, 20))
         
         # Add generation info
@@ -141,7 +479,7 @@ class EngineeringPDFReportGenerator:
     
     def _add_metadata_section(self, story: List, design_criteria: Dict[str, Any]):
         """Add document metadata section."""
-        story.append(Paragraph("Document Information", self.styles['SectionHeader']))
+        story.append(self._static_paragraph("Document Information", 'SectionHeader'))
         
         metadata = design_criteria.get('metadata', {})
         
@@ -152,20 +490,11 @@ class EngineeringPDFReportGenerator:
             ['File Size', f"{metadata.get('file_size', 0):,} bytes"],
             ['Page Count', str(metadata.get('page_count', 'N/A'))],
             ['Processing Date', str(metadata.get('processing_date', 'N/A'))],
-            ['Overall Confidence', f"{design_criteria.get('confidence_score', 0) * 100:.1f}%"]
+            ['Overall Confidence', self._pct(design_criteria.get('confidence_score', 0))]
         ]
         
         table = Table(metadata_data, colWidths=[4*cm, 8*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(_METADATA_TABLE_STYLE)
         
         story.append(table)
         story.append(Spacer(1, 30))
@@ -173,19 +502,12 @@ class EngineeringPDFReportGenerator:
     def _add_specific_fields_section(self, story: List, design_criteria: Dict[str, Any], 
                                    image_base_path: str, job_id: str):
         """Add specific extracted fields section."""
-        story.append(Paragraph("Extracted Fields", self.styles['SectionHeader']))
-        
-        # Define the new field types
-        field_types = [
-            'berthing_loads', 'date', 'design_criteria', 'design_loads',
-            'drawing_number', 'drawing_title', 'mooring_loads', 
-            'vertical_dead_loads', 'vertical_live_loads', 'wind_loads'
-        ]
+        story.append(self._static_paragraph("Extracted Fields", 'SectionHeader'))
         
         # Get images for matching with fields
         images = design_criteria.get('images', [])
         
-        for field_type in field_types:
+        for field_type in _FIELD_TYPES:
             field_data = design_criteria.get(field_type, [])
             if field_data:
                 self._add_field_section(story, field_type, field_data, image_base_path, job_id, images)
@@ -196,16 +518,19 @@ class EngineeringPDFReportGenerator:
                           image_base_path: str, job_id: str, images: List[Dict]):
         """Add a specific field section with text and images."""
         # Format field name for display
-        display_name = field_type.replace('_', ' ').title()
+        display_name = _FIELD_DISPLAY.get(field_type) or field_type.replace('_', ' ').title()
         story.append(Paragraph(display_name, self.styles['FieldHeader']))
         
+        # Skip image matching for every item when there is nothing to match against
+        has_images = bool(images) and bool(image_base_path)
+        
         for i, field_item in enumerate(field_data):
             # Add field text
             field_text = field_item.get('text', 'No text available')
             confidence = field_item.get('confidence', 0)
             
             text_content = f"<b>Text:</b> {field_text}<br/>"
-            text_content += f"<b>Confidence:</b> {confidence * 100:.1f}%<br/>"
+            text_content += f"<b>Confidence:</b> {self._pct(confidence)}<br/>"
             
             if field_item.get('page_number'):
                 text_content += f"<b>Page:</b> {field_item['page_number']}<br/>"
@@ -213,7 +538,8 @@ class EngineeringPDFReportGenerator:
             story.append(Paragraph(text_content, self.styles['Normal']))
             
             # Add associated image if available
-            self._add_field_image_from_results(story, field_type, field_text, images, image_base_path)
+            if has_images:
+                self._add_field_image_from_results(story, field_type, field_text, images, image_base_path)
             
             story.append(Spacer(1, 15))
     
@@ -230,28 +556,18 @@ class EngineeringPDFReportGenerator:
             f"entity_{field_type}_{index}.png"
         ]
         
+        job_dir = os.path.join(image_base_path, job_id)
+        job_files = self._list_job_files(job_dir)
+        
         for image_filename in possible_filenames:
-            image_path = os.path.join(image_base_path, job_id, image_filename)
-            
-            if os.path.exists(image_path):
+            if image_filename in job_files:
+                image_path = os.path.join(job_dir, image_filename)
                 try:
-                    # Check image dimensions and resize if needed
-                    with Image.open(image_path) as img:
-                        img_width, img_height = img.size
-                        
-                        # Calculate scaling to fit within reasonable bounds
-                        max_width = 4 * inch
-                        max_height = 3 * inch
-                        
-                        width_scale = max_width / img_width
-                        height_scale = max_height / img_height
-                        scale = min(width_scale, height_scale, 1.0)
-                        
-                        final_width = img_width * scale
-                        final_height = img_height * scale
+                    # Scale image to fit within 4x3 inches
+                    final_width, final_height = self._fitted_size(image_path, *_FIELD_IMAGE_BOUNDS)
                     
                     # Add image to story
-                    rl_img = RLImage(image_path, width=final_width, height=final_height)
+                    rl_img = self._image_flowable(image_path, final_width, final_height)
                     story.append(rl_img)
                     story.append(Paragraph(f"<i>Entity Image: {image_filename}</i>", self.styles['Metadata']))
                     return  # Successfully added image, exit function
@@ -263,23 +579,26 @@ class EngineeringPDFReportGenerator:
     
     def _add_field_image_from_results(self, story: List, field_type: str, field_text: str, 
                                      images: List[Dict], image_base_path: str):
-        """Add field image by matching with extraction results."""
-        if not images or not image_base_path:
-            return
+        """Add field image by matching with extraction results; callers check images and image_base_path are set."""
+        self._index_images(images)
+        
+        # Match terms, computed once for all images
+        field_type_lower = field_type.lower()
+        field_type_flat = field_type.replace('_', '')
+        field_words = tuple(dict.fromkeys(word.lower() for word in field_text.split(None, 3)[:3])) if field_text else ()
         
-        # Try to find matching image by field type or text content
+        # Try to find matching image by field type or text content; only the first match is used
         matching_images = []
         
-        for image in images:
-            image_type = image.get('image_type', '').lower()
-            description = image.get('description', '').lower()
-            
+        for image, image_type, _, description in self._image_meta:
             # Match by field type
-            if field_type.lower() in image_type or field_type.replace('_', '') in image_type:
+            if field_type_lower in image_type or field_type_flat in image_type:
                 matching_images.append(image)
+                break
             # Match by text content (for more specific matching)
-            elif field_text and any(word.lower() in description for word in field_text.split()[:3]):
+            elif field_words and any(word in description for word in field_words):
                 matching_images.append(image)
+                break
         
         # Add the first matching image
         for image in matching_images[:1]:  # Only add first match
@@ -287,25 +606,13 @@ class EngineeringPDFReportGenerator:
             if file_path:
                 full_image_path = os.path.join(image_base_path, file_path)
                 
-                if os.path.exists(full_image_path):
+                if self._path_exists(full_image_path):
                     try:
-                        # Check image dimensions and resize if needed
-                        with Image.open(full_image_path) as img:
-                            img_width, img_height = img.size
-                            
-                            # Calculate scaling to fit within reasonable bounds
-                            max_width = 4 * inch
-                            max_height = 3 * inch
-                            
-                            width_scale = max_width / img_width
-                            height_scale = max_height / img_height
-                            scale = min(width_scale, height_scale, 1.0)
-                            
-                            final_width = img_width * scale
-                            final_height = img_height * scale
+                        # Scale image to fit within 4x3 inches
+                        final_width, final_height = self._fitted_size(full_image_path, *_FIELD_IMAGE_BOUNDS)
                         
                         # Add image to story
-                        rl_img = RLImage(full_image_path, width=final_width, height=final_height)
+                        rl_img = self._image_flowable(full_image_path, final_width, final_height)
                         story.append(rl_img)
                         story.append(Paragraph(f"<i>Image: {os.path.basename(file_path)}</i>", self.styles['Metadata']))
                         break  # Successfully added image, exit
@@ -320,22 +627,27 @@ class EngineeringPDFReportGenerator:
         if not entities:
             return
         
-        story.append(Paragraph("Document AI Entities", self.styles['SectionHeader']))
+        story.append(self._static_paragraph("Document AI Entities", 'SectionHeader'))
         
-        # Get images for matching
+        # Get images for matching, skipped for every entity when there is nothing to match against
         images = design_criteria.get('images', [])
+        has_images = bool(images) and bool(image_base_path)
         
         for i, entity in enumerate(entities):
             # Entity header
             entity_type = entity.get('type', 'Unknown')
             confidence = entity.get('confidence', 0)
             
-            header_text = f"<b>{entity_type}</b> (Confidence: {confidence * 100:.1f}%)"
+            header_text = f"<b>{entity_type}</b> (Confidence: {self._pct(confidence)})"
             story.append(Paragraph(header_text, self.styles['FieldHeader']))
             
             # Entity text
-            entity_text = entity.get('text', 'No text available')
-            story.append(Paragraph(entity_text, self.styles['EntityText']))
+            if 'text' not in entity:
+                entity_text = 'No text available'
+                story.append(self._static_paragraph(entity_text, 'EntityText'))
+            else:
+                entity_text = entity['text']
+                story.append(Paragraph(entity_text, self.styles['EntityText']))
             
             # Bounding box info
             bbox = entity.get('bounding_box')
@@ -348,7 +660,8 @@ class EngineeringPDFReportGenerator:
             story.append(Spacer(1, 10))
             
             # Add entity image if available - use both methods for better matching
-            self._add_entity_image_from_results(story, entity_type, entity_text, images, image_base_path)
+            if has_images:
+                self._add_entity_image_from_results(story, entity_type, entity_text, images, image_base_path)
             
             # Add larger spacing between entities
             story.append(Spacer(1, 30))
@@ -366,26 +679,17 @@ class EngineeringPDFReportGenerator:
             f"{entity_type.lower()}_{index}.png"
         ]
         
+        job_dir = os.path.join(image_base_path, job_id)
+        job_files = self._list_job_files(job_dir)
+        
         for filename in possible_filenames:
-            image_path = os.path.join(image_base_path, job_id, filename)
-            if os.path.exists(image_path):
+            if filename in job_files:
+                image_path = os.path.join(job_dir, filename)
                 try:
-                    # Add image with proper sizing
-                    with Image.open(image_path) as img:
-                        img_width, img_height = img.size
-                        
-                        # Scale image to fit page
-                        max_width = 5 * inch
-                        max_height = 4 * inch
-                        
-                        width_scale = max_width / img_width
-                        height_scale = max_height / img_height
-                        scale = min(width_scale, height_scale, 1.0)
-                        
-                        final_width = img_width * scale
-                        final_height = img_height * scale
+                    # Scale image to fit within 5x4 inches
+                    final_width, final_height = self._fitted_size(image_path, *_ENTITY_IMAGE_BOUNDS)
                     
-                    rl_img = RLImage(image_path, width=final_width, height=final_height)
+                    rl_img = self._image_flowable(image_path, final_width, final_height)
                     story.append(rl_img)
                     story.append(Paragraph(f"<i>Entity Image: {filename}</i>", self.styles['Metadata']))
                     return
@@ -394,50 +698,64 @@ class EngineeringPDFReportGenerator:
                     logger.warning(f"Could not add entity image {image_path}: {str(e)}")
         
         # If no image found, add placeholder text
-        story.append(Paragraph("<i>No entity image available</i>", self.styles['Metadata']))
+        story.append(self._static_paragraph("<i>No entity image available</i>", 'Metadata'))
     
-    def _add_entity_image_from_results(self, story: List, entity_type: str, entity_text: str, 
-                                      images: List[Dict], image_base_path: str):
-        """Add entity image by matching with extraction results."""
-        if not images or not image_base_path:
-            return
+    def _best_entity_image(self, entity_type: str) -> Optional[tuple]:
+        """
+        Find the result image that best matches an entity type, using the current image index.
         
-        # Debug: Log available images for this entity
-        logger.info(f"Looking for image for entity '{entity_type}'")
-        logger.info(f"Available images: {[img.get('image_type', 'unknown') for img in images]}")
-        logger.info(f"Available file paths: {[img.get('file_path', 'unknown') for img in images]}")
+        Args:
+            entity_type: Document AI entity type
+            
+        Returns:
+            Tuple of (image dictionary, match priority), or None if no image matches
+        """
+        # Match terms, computed once for all images
+        entity_type_lower = entity_type.lower()
+        entity_type_flat = entity_type_lower.replace('_', '')
+        entity_type_words = entity_type_lower.split('_')
+        entity_file_prefix = f"entity_{entity_type_flat}_"
         
-        # Try to find matching image by entity type with precise matching
-        matching_images = []
+        # Priority 1: Exact match by image_type, looked up in the index
+        matching_images = [(image, 1) for image in self._image_index.get(f"entity_{entity_type_lower}", [])[:1]]
         
-        for image in images:
-            image_type = image.get('image_type', '').lower()
-            file_path = image.get('file_path', '').lower()
-            description = image.get('description', '').lower()
-            
-            # Priority 1: Exact match by image_type
-            if image_type == f"entity_{entity_type.lower()}":
-                matching_images.append((image, 1))
+        # Otherwise scan the indexed images for the looser matches
+        for image, image_type, file_path, description in (self._image_meta if not matching_images else ()):
             # Priority 2: Exact match by filename (most reliable)
-            elif os.path.basename(file_path) == f"entity_{entity_type.lower().replace('_', '')}_{image.get('image_id', '').split('_')[-1]}.png":
+            if os.path.basename(file_path) == f"{entity_file_prefix}{image.get('image_id', '').split('_')[-1]}.png":
                 matching_images.append((image, 2))
             # Priority 3: Match by entity type in file_path (handles variations)
-            elif entity_type.lower().replace('_', '') in file_path.replace('_', ''):
+            elif entity_type_flat in file_path.replace('_', ''):
                 matching_images.append((image, 3))
             # Priority 4: Match by key words in entity type (more specific matching)
-            elif all(word in file_path for word in entity_type.lower().split('_')):
+            elif all(word in file_path for word in entity_type_words):
                 matching_images.append((image, 4))
             # Priority 5: Match by entity type in description
-            elif entity_type.lower() in description:
+            elif entity_type_lower in description:
                 matching_images.append((image, 5))
         
-        # Sort by priority and take the best match
-        if matching_images:
-            matching_images.sort(key=lambda x: x[1])  # Sort by priority (lower is better)
-            best_match = matching_images[0][0]  # Get the image from the best match
+        if not matching_images:
+            return None
+        matching_images.sort(key=lambda x: x[1])  # Sort by priority (lower is better)
+        return matching_images[0]
+    
+    def _add_entity_image_from_results(self, story: List, entity_type: str, entity_text: str, 
+                                      images: List[Dict], image_base_path: str):
+        """Add entity image by matching with extraction results; callers check images and image_base_path are set."""
+        # Debug: Log available images for this entity
+        logger.info(f"Looking for image for entity '{entity_type}'")
+        logger.info(f"Available images: {[img.get('image_type', 'unknown') for img in images]}")
+        logger.info(f"Available file paths: {[img.get('file_path', 'unknown') for img in images]}")
+        
+        self._index_images(images)
+        
+        # Take the highest priority match
+        match = self._best_entity_image(entity_type)
+        if match is not None:
+            best_match, priority = match
             
             # Log the matching process for debugging
-            logger.info(f"Entity '{entity_type}' matched with image: {best_match.get('image_type', 'unknown')} (Priority {matching_images[0][1]})")
+            logger.info(f"Entity '{entity_type}' matched with image: {best_match.get('image_type', 'unknown')} (Priority {priority})")
             logger.info(f"Matched image file: {best_match.get('file_path', 'unknown')}")
             
             # Use the best matching image
@@ -445,46 +763,21 @@ class EngineeringPDFReportGenerator:
             if file_path:
                 full_image_path = os.path.join(image_base_path, file_path)
                 
-                if os.path.exists(full_image_path):
+                if self._path_exists(full_image_path):
                     try:
-                        # Check image dimensions and resize if needed
-                        with Image.open(full_image_path) as img:
-                            img_width, img_height = img.size
-                            
-                            # Calculate scaling to fit within reasonable bounds
-                            max_width = 5 * inch
-                            max_height = 4 * inch
-                            
-                            width_scale = max_width / img_width
-                            height_scale = max_height / img_height
-                            scale = min(width_scale, height_scale, 1.0)
-                            
-                            final_width = img_width * scale
-                            final_height = img_height * scale
+                        # Scale image to fit within 5x4 inches
+                        final_width, final_height = self._fitted_size(full_image_path, *_ENTITY_IMAGE_BOUNDS)
                         
                         # Add image with border and spacing
                         story.append(Spacer(1, 15))  # Space before image
                         
                         # Create image with border using Table
-                        rl_img = RLImage(full_image_path, width=final_width, height=final_height)
+                        rl_img = self._image_flowable(full_image_path, final_width, final_height)
                         image_caption = Paragraph(f"<i>Entity Image: {os.path.basename(file_path)}</i>", self.styles['Metadata'])
                         
                         # Create table with image and caption for border effect
                         image_table = Table([[rl_img], [image_caption]], colWidths=[final_width + 40])
-                        image_table.setStyle(TableStyle([
-                            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                            ('GRID', (0, 0), (-1, -1), 3, colors.black),  # Thicker black border
-                            ('BACKGROUND', (0, 0), (0, 0), colors.lightgrey),  # Light background for image
-                            ('BACKGROUND', (0, 1), (0, 1), colors.white),     # White background for caption
-                            ('LEFTPADDING', (0, 0), (-1, -1), 15),   # Increased padding
-                            ('RIGHTPADDING', (0, 0), (-1, -1), 15),  # Increased padding
-                            ('TOPPADDING', (0, 0), (0, 0), 15),     # Image cell top padding
-                            ('BOTTOMPADDING', (0, 0), (0, 0), 10),  # Image cell bottom padding
-                            ('TOPPADDING', (0, 1), (0, 1), 8),      # Caption cell top padding
-                            ('BOTTOMPADDING', (0, 1), (0, 1), 15),  # Caption cell bottom padding
-                            ('ROWBACKGROUNDS', (0, 0), (-1, -1), [colors.lightgrey, colors.white]),
-                        ]))
+                        image_table.setStyle(_ENTITY_IMAGE_TABLE_STYLE)
                         
                         story.append(image_table)
                         story.append(Spacer(1, 20))  # Space after image
@@ -501,7 +794,7 @@ class EngineeringPDFReportGenerator:
             return
         
         story.append(PageBreak())
-        story.append(Paragraph("Extracted Images", self.styles['SectionHeader']))
+        story.append(self._static_paragraph("Extracted Images", 'SectionHeader'))
         
         # Limit to first 6 images like the web interface
         for i, image in enumerate(images[:6]):
@@ -510,13 +803,14 @@ class EngineeringPDFReportGenerator:
             description = image.get('description', 'No description available')
             confidence = image.get('confidence', 0)
             
-            header_text = f"<b>Image {i+1}: {image_type}</b> (Confidence: {confidence * 100:.1f}%)"
+            header_text = f"<b>Image {i+1}: {image_type}</b> (Confidence: {self._pct(confidence)})"
             story.append(Paragraph(header_text, self.styles['FieldHeader']))
             
             # Image description
-            if description and len(description) > 10:
+            description_length = len(description) if description else 0
+            if description_length > 10:
                 # Truncate long descriptions
-                short_desc = description[:200] + "..." if len(description) > 200 else description
+                short_desc = description if description_length <= 200 else description[:200] + "..."
                 story.append(Paragraph(f"<i>{short_desc}</i>", self.styles['Metadata']))
             
             # Add the actual image
@@ -524,36 +818,24 @@ class EngineeringPDFReportGenerator:
             if file_path and image_base_path:
                 full_image_path = os.path.join(image_base_path, file_path)
                 
-                if os.path.exists(full_image_path):
+                if self._path_exists(full_image_path):
                     try:
-                        # Check image dimensions and resize if needed
-                        with Image.open(full_image_path) as img:
-                            img_width, img_height = img.size
-                            
-                            # Calculate scaling to fit within reasonable bounds
-                            max_width = 6 * inch
-                            max_height = 4 * inch
-                            
-                            width_scale = max_width / img_width
-                            height_scale = max_height / img_height
-                            scale = min(width_scale, height_scale, 1.0)
-                            
-                            final_width = img_width * scale
-                            final_height = img_height * scale
+                        # Scale image to fit within 6x4 inches
+                        final_width, final_height = self._fitted_size(full_image_path, *_EXTRACTED_IMAGE_BOUNDS)
                         
                         # Add image to story
-                        rl_img = RLImage(full_image_path, width=final_width, height=final_height)
+                        rl_img = self._image_flowable(full_image_path, final_width, final_height)
                         story.append(rl_img)
                         
                         # Add image metadata
                         page_num = image.get('page_number', 0)
                         bbox = image.get('bounding_box')
-                        metadata_text = f"<i>File: {os.path.basename(file_path)}"
+                        metadata_parts = [f"File: {os.path.basename(file_path)}"]
                         if page_num is not None:
-                            metadata_text += f" | Page: {page_num}"
+                            metadata_parts.append(f"Page: {page_num}")
                         if bbox:
-                            metadata_text += f" | Location: ({bbox.get('x', 0):.0f}, {bbox.get('y', 0):.0f})"
-                        metadata_text += "</i>"
+                            metadata_parts.append(f"Location: ({bbox.get('x', 0):.0f}, {bbox.get('y', 0):.0f})")
+                        metadata_text = f"<i>{' | '.join(metadata_parts)}</i>"
                         
                         story.append(Paragraph(metadata_text, self.styles['Metadata']))
                         
@@ -578,15 +860,14 @@ class EngineeringPDFReportGenerator:
             return
         
         story.append(PageBreak())
-        story.append(Paragraph("Raw Extracted Text", self.styles['SectionHeader']))
+        story.append(self._static_paragraph("Raw Extracted Text", 'SectionHeader'))
         
-        # Split long text into chunks to avoid memory issues
+        # Split long text into chunks to avoid memory issues, slicing one chunk at a time
         max_chunk_size = 2000
-        text_chunks = [raw_text[i:i+max_chunk_size] for i in range(0, len(raw_text), max_chunk_size)]
         
-        for chunk in text_chunks:
-            # Clean and format text
-            clean_chunk = chunk.replace('<', '&lt;').replace('>', '&gt;')
+        for start in range(0, len(raw_text), max_chunk_size):
+            # Escape markup in a single pass
+            clean_chunk = escape(raw_text[start:start + max_chunk_size], quote=False)
             story.append(Paragraph(clean_chunk, self.styles['EntityText']))
             story.append(Spacer(1, 10))
     
@@ -595,18 +876,11 @@ class EngineeringPDFReportGenerator:
         # Count non-empty fields
         field_counts = []
         
-        field_types = [
-            'berthing_loads', 'date', 'design_criteria', 'design_loads',
-            'drawing_number', 'drawing_title', 'mooring_loads', 
-            'vertical_dead_loads', 'vertical_live_loads', 'wind_loads'
-        ]
-        
-        for field_type in field_types:
+        for field_type in _FIELD_TYPES:
             field_data = design_criteria.get(field_type, [])
             count = len(field_data) if field_data else 0
             if count > 0:
-                display_name = field_type.replace('_', ' ').title()
-                field_counts.append([display_name, str(count)])
+                field_counts.append([_FIELD_DISPLAY[field_type], str(count)])
         
         if not field_counts:
             return None
@@ -615,17 +889,7 @@ class EngineeringPDFReportGenerator:
         table_data = [['Field Type', 'Count']] + field_counts
         
         table = Table(table_data, colWidths=[6*cm, 3*cm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightblue),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        table.setStyle(_SUMMARY_TABLE_STYLE)
         
         return table
 
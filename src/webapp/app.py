@@ -3,24 +3,55 @@ Flask web application for engineering design criteria extraction.
 """
 
 import os
+import io
 import sys
+import stat
+import shutil
+import atexit
+import tempfile
+import threading
 import uuid
 import json
-from datetime import datetime
-from pathlib import Path
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, send_file
+import mimetypes
+from datetime import date, datetime
+from typing import Optional
+from flask import Flask, current_app, render_template, request, redirect, url_for, flash, jsonify, send_file
 from werkzeug.utils import secure_filename
+from werkzeug.security import safe_join
+from werkzeug.http import http_date
 from werkzeug.exceptions import RequestEntityTooLarge
-import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from loguru import logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..core.extractor import EngineeringCriteriaExtractor
 from ..models.schemas import ExtractionResult
 from ..models.document_models import ProcessingStatus
+from .job_store import JobStore
 
 # Add parent directory to path for utils import
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Chunk size for streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Number of most recent jobs shown on the job list page
+JOB_LIST_LIMIT = 50
+
+# Number of finished jobs whose serialized status is kept for polling clients
+STATUS_CACHE_SIZE = 1024
+
+# Browser cache lifetime for extracted images, in seconds
+IMAGE_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Extractor shared by all jobs in this process; created on first use
+_extractor = None
+_extractor_lock = threading.Lock()
+
 
 def _get_base_dir() -> str:
     """Return a stable base directory both in dev and PyInstaller-frozen builds.
@@ -38,6 +69,126 @@ def _get_base_dir() -> str:
     return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
+# Writable data locations, resolved once at import
+BASE_DIR = _get_base_dir()
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+UPLOAD_FOLDER = os.path.join(DATA_DIR, 'uploads')
+OUTPUT_FOLDER = os.path.join(DATA_DIR, 'output')
+EXTRACTED_IMAGES_FOLDER = os.path.join(DATA_DIR, 'extracted_images')
+JOBS_DB_PATH = os.path.join(DATA_DIR, 'jobs.db')
+
+
+def _create_extractor() -> EngineeringCriteriaExtractor:
+    """Create the engineering criteria extractor from environment configuration.
+
+    Resolves `GOOGLE_APPLICATION_CREDENTIALS` to an absolute path so the
+    packaged executable can find a credentials file placed next to it.
+    """
+    project_id = os.getenv("GOOGLE_CLOUD_PROJECT_ID")
+    processor_id = os.getenv("DOCUMENT_AI_PROCESSOR_ID")
+    location = os.getenv("DOCUMENT_AI_LOCATION", "us")
+
+    # Resolve service account key path if provided and relative
+    credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    if credentials_path:
+        if not os.path.isabs(credentials_path):
+            candidate = os.path.join(BASE_DIR, credentials_path)
+            if os.path.exists(candidate):
+                os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = candidate
+            else:
+                # Also try just the filename next to the executable
+                alt_candidate = os.path.join(BASE_DIR, os.path.basename(credentials_path))
+                if os.path.exists(alt_candidate):
+                    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = alt_candidate
+                else:
+                    raise FileNotFoundError(f"File {credentials_path} was not found. Place it next to the executable or set GOOGLE_APPLICATION_CREDENTIALS to an absolute path.")
+        else:
+            if not os.path.exists(credentials_path):
+                raise FileNotFoundError(f"File {credentials_path} was not found. Place it next to the executable or set GOOGLE_APPLICATION_CREDENTIALS to an existing absolute path.")
+
+    if not project_id or not processor_id:
+        raise ValueError("Google Cloud configuration not found. Please set GOOGLE_CLOUD_PROJECT_ID and DOCUMENT_AI_PROCESSOR_ID environment variables.")
+
+    return EngineeringCriteriaExtractor(
+        project_id=project_id,
+        processor_id=processor_id,
+        location=location,
+    )
+
+
+def _json_default(obj):
+    """Encode values orjson passes through the way Flask's JSON provider does: dates as HTTP dates, the rest as strings."""
+    if isinstance(obj, date):
+        return http_date(obj)
+    return str(obj)
+
+
+def _fast_json(data):
+    """Build a JSON response with orjson, falling back to jsonify when it is not installed."""
+    if orjson is None:
+        return jsonify(data)
+    body = orjson.dumps(
+        data,
+        default=_json_default,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+    return current_app.response_class(body, mimetype='application/json')
+
+
+def _write_json_atomic(path: str, data: dict):
+    """Write JSON to a temporary file beside `path` and rename it into place, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.json.tmp')
+    try:
+        if orjson is not None:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+                ))
+        else:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _get_extractor() -> EngineeringCriteriaExtractor:
+    """Get the process-wide extractor, creating it on first use.
+
+    The Document AI client behind it is thread-safe, so one instance serves every job
+    and its gRPC channel and credentials are set up only once. A configuration error
+    is raised again on the next call rather than cached.
+    """
+    global _extractor
+    if _extractor is None:
+        with _extractor_lock:
+            if _extractor is None:
+                _extractor = _create_extractor()
+    return _extractor
+
+
+def _run_extraction(file_path: str, output_dir: str) -> ExtractionResult:
+    """Extract criteria from an uploaded file; module-level so it can run in a worker process."""
+    return _get_extractor().extract_from_file(file_path, output_dir)
+
+
+def _create_extraction_pool() -> Optional[ProcessPoolExecutor]:
+    """Create the process pool selected by EXTRACTOR_EXECUTOR, or None to extract in-thread.
+
+    Setting EXTRACTOR_EXECUTOR=process moves extraction out of the web server process,
+    so CPU-heavy PDF work does not compete with request handling for the GIL and a
+    crashing extraction cannot take the server down. EXTRACTOR_PROCESSES bounds the
+    number of worker processes.
+    """
+    if os.getenv("EXTRACTOR_EXECUTOR", "thread").lower() != "process":
+        return None
+    workers = int(os.getenv("EXTRACTOR_PROCESSES", "0")) or None
+    return ProcessPoolExecutor(max_workers=workers)
+
+
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
@@ -47,10 +198,9 @@ def create_app():
     app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max file size
     
     # Use absolute paths relative to a stable base directory (handles PyInstaller)
-    project_root = _get_base_dir()
-    app.config['UPLOAD_FOLDER'] = os.path.join(project_root, 'data', 'uploads')
-    app.config['OUTPUT_FOLDER'] = os.path.join(project_root, 'data', 'output')
-    app.config['EXTRACTED_IMAGES_FOLDER'] = os.path.join(project_root, 'data', 'extracted_images')
+    app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+    app.config['OUTPUT_FOLDER'] = OUTPUT_FOLDER
+    app.config['EXTRACTED_IMAGES_FOLDER'] = EXTRACTED_IMAGES_FOLDER
     app.config['ALLOWED_EXTENSIONS'] = {'pdf'}
     
     # Create directories
@@ -58,76 +208,91 @@ def create_app():
     os.makedirs(app.config['OUTPUT_FOLDER'], exist_ok=True)
     os.makedirs(app.config['EXTRACTED_IMAGES_FOLDER'], exist_ok=True)
     
-    # In-memory storage for job tracking (in production, use a database)
-    jobs = {}
+    # Job tracking persisted in SQLite so jobs survive restarts
+    jobs = JobStore(JOBS_DB_PATH)
+    
+    # Serialized status of finished jobs by id; a finished job's status never changes
+    status_cache = {}
+    # Request threads share the cache; guards eviction and insertion
+    status_cache_lock = threading.Lock()
+    
+    # Bounded pool for background processing; threads are reused across uploads
+    executor = ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) + 4),
+        thread_name_prefix="extractor"
+    )
+    
+    # Optional worker processes that run the extraction itself
+    extraction_pool = _create_extraction_pool()
+    
+    # Futures of submitted work that has not finished, so queued work can be cancelled
+    pending_futures = set()
+    
+    def track(future):
+        """Keep a future in pending_futures until it is done."""
+        pending_futures.add(future)
+        future.add_done_callback(pending_futures.discard)
+        return future
+    
+    def shutdown_workers():
+        """
+        Cancel queued jobs when the server stops.
+        
+        Jobs already running still finish before the process exits, since the pool's threads
+        are joined at interpreter shutdown. Jobs cancelled before they started stay pending
+        and are marked as failed by the job store on the next start.
+        """
+        # Cancelled one by one; shutdown(cancel_futures=True) needs Python 3.9
+        for future in list(pending_futures):
+            future.cancel()
+        executor.shutdown(wait=False)
+        if extraction_pool is not None:
+            extraction_pool.shutdown(wait=False)
+    
+    # Servers call this when they stop; atexit covers other hosts, though it runs only after
+    # the running jobs have finished
+    app.extensions['shutdown_workers'] = shutdown_workers
+    atexit.register(shutdown_workers)
+    
+    # Allowed extensions as suffixes, so checking a filename is a single endswith
+    allowed_suffixes = tuple(f".{extension}" for extension in app.config['ALLOWED_EXTENSIONS'])
     
     def allowed_file(filename):
         """Check if file extension is allowed."""
-        return '.' in filename and \
-               filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+        return filename.lower().endswith(allowed_suffixes)
     
     def get_extractor():
-        """Get or create the engineering criteria extractor.
-
-        Resolves `GOOGLE_APPLICATION_CREDENTIALS` to an absolute path so the
-        packaged executable can find a credentials file placed next to it.
-        """
-        project_id = os.getenv("GOOGLE_CLOUD_PROJECT_ID")
-        processor_id = os.getenv("DOCUMENT_AI_PROCESSOR_ID")
-        location = os.getenv("DOCUMENT_AI_LOCATION", "us")
-
-        # Resolve service account key path if provided and relative
-        credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-        if credentials_path:
-            if not os.path.isabs(credentials_path):
-                candidate = os.path.join(_get_base_dir(), credentials_path)
-                if os.path.exists(candidate):
-                    os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = candidate
-                else:
-                    # Also try just the filename next to the executable
-                    alt_candidate = os.path.join(_get_base_dir(), os.path.basename(credentials_path))
-                    if os.path.exists(alt_candidate):
-                        os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = alt_candidate
-                    else:
-                        raise FileNotFoundError(f"File {credentials_path} was not found. Place it next to the executable or set GOOGLE_APPLICATION_CREDENTIALS to an absolute path.")
-            else:
-                if not os.path.exists(credentials_path):
-                    raise FileNotFoundError(f"File {credentials_path} was not found. Place it next to the executable or set GOOGLE_APPLICATION_CREDENTIALS to an existing absolute path.")
-
-        if not project_id or not processor_id:
-            raise ValueError("Google Cloud configuration not found. Please set GOOGLE_CLOUD_PROJECT_ID and DOCUMENT_AI_PROCESSOR_ID environment variables.")
-
-        return EngineeringCriteriaExtractor(
-            project_id=project_id,
-            processor_id=processor_id,
-            location=location,
-        )
+        """Get or create the engineering criteria extractor."""
+        return _get_extractor()
     
     def process_document_async(job_id, file_path):
         """Process document in background thread."""
         try:
-            jobs[job_id]['status'] = ProcessingStatus.PROCESSING
-            jobs[job_id]['started_at'] = datetime.now()
+            jobs.update(job_id, status=ProcessingStatus.PROCESSING, started_at=datetime.now())
             
-            extractor = get_extractor()
-            result = extractor.extract_from_file(file_path, app.config['OUTPUT_FOLDER'])
+            if extraction_pool is not None:
+                result = track(extraction_pool.submit(_run_extraction, file_path, app.config['OUTPUT_FOLDER'])).result()
+            else:
+                result = _run_extraction(file_path, app.config['OUTPUT_FOLDER'])
             
-            jobs[job_id].update({
-                'status': result.status,
-                'result': result,
-                'completed_at': datetime.now(),
-                'error_message': result.error_message
-            })
+            jobs.update(
+                job_id,
+                status=result.status,
+                result=result,
+                completed_at=datetime.now(),
+                error_message=result.error_message
+            )
             
             logger.info(f"Completed processing job {job_id}")
             
         except Exception as e:
             logger.error(f"Error processing job {job_id}: {str(e)}")
-            jobs[job_id].update({
-                'status': ProcessingStatus.FAILED,
-                'error_message': str(e),
-                'completed_at': datetime.now()
-            })
+            jobs.update(
+                job_id,
+                status=ProcessingStatus.FAILED,
+                error_message=str(e),
+                completed_at=datetime.now()
+            )
     
     @app.route('/')
     def index():
@@ -143,13 +308,11 @@ def create_app():
     def upload_file():
         """Handle file upload and start processing."""
         try:
-            # Debug: Print request information
-            print(f"DEBUG: Request files: {list(request.files.keys())}")
-            print(f"DEBUG: Request form: {list(request.form.keys())}")
+            logger.debug("Upload request files: {}, form: {}", list(request.files.keys()), list(request.form.keys()))
             
             # Check if file was uploaded
             if 'file' not in request.files:
-                print("DEBUG: No 'file' in request.files")
+                logger.debug("No 'file' in upload request")
                 flash('No file selected', 'error')
                 return redirect(url_for('index'))
             
@@ -170,11 +333,12 @@ def create_app():
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             unique_filename = f"{timestamp}_{filename}"
             file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-            file.save(file_path)
+            with open(file_path, 'wb', buffering=0) as raw, io.BufferedWriter(raw, buffer_size=UPLOAD_CHUNK_SIZE) as out:
+                shutil.copyfileobj(file.stream, out, length=UPLOAD_CHUNK_SIZE)
             
             # Create job
             job_id = str(uuid.uuid4())
-            jobs[job_id] = {
+            jobs.create({
                 'id': job_id,
                 'filename': filename,
                 'file_path': file_path,
@@ -182,15 +346,10 @@ def create_app():
                 'created_at': datetime.now(),
                 'result': None,
                 'error_message': None
-            }
+            })
             
             # Start background processing
-            thread = threading.Thread(
-                target=process_document_async,
-                args=(job_id, file_path)
-            )
-            thread.daemon = True
-            thread.start()
+            track(executor.submit(process_document_async, job_id, file_path))
             
             flash(f'File uploaded successfully. Processing started. Job ID: {job_id[:8]}', 'success')
             return redirect(url_for('job_status', job_id=job_id))
@@ -205,21 +364,26 @@ def create_app():
     @app.route('/job/<job_id>')
     def job_status(job_id):
         """Show job status and results."""
-        if job_id not in jobs:
+        job = jobs.get(job_id)
+        if job is None:
             flash('Job not found', 'error')
             return redirect(url_for('index'))
         
-        job = jobs[job_id]
         return render_template('job_status.html', job=job)
     
     @app.route('/api/job/<job_id>')
     def api_job_status(job_id):
         """API endpoint for job status."""
-        if job_id not in jobs:
+        with status_cache_lock:
+            payload = status_cache.get(job_id)
+        if payload is not None:
+            return app.response_class(payload, mimetype='application/json')
+        
+        job = jobs.get(job_id, include_result=False)
+        if job is None:
             return jsonify({'error': 'Job not found'}), 404
         
-        job = jobs[job_id]
-        return jsonify({
+        response = _fast_json({
             'id': job['id'],
             'filename': job['filename'],
             'status': job['status'],
@@ -228,15 +392,25 @@ def create_app():
             'completed_at': job['completed_at'].isoformat() if job.get('completed_at') else None,
             'error_message': job.get('error_message')
         })
+        
+        # Finished jobs are polled until the client notices, so serialize them only once
+        if job['status'] in (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED):
+            payload = response.get_data()
+            with status_cache_lock:
+                if job_id not in status_cache and len(status_cache) >= STATUS_CACHE_SIZE:
+                    # Drop the oldest entry
+                    del status_cache[next(iter(status_cache))]
+                status_cache[job_id] = payload
+        
+        return response
     
     @app.route('/api/job/<job_id>/results')
     def api_job_results(job_id):
         """API endpoint for job results."""
-        if job_id not in jobs:
+        job = jobs.get(job_id)
+        if job is None:
             return jsonify({'error': 'Job not found'}), 404
         
-        job = jobs[job_id]
-        
         if job['status'] != ProcessingStatus.COMPLETED:
             return jsonify({'error': 'Job not completed'}), 400
         
@@ -252,24 +426,29 @@ def create_app():
             'created_at': job['result'].created_at.isoformat()
         }
         
-        return jsonify(result_data)
+        return _fast_json(result_data)
     
     @app.route('/jobs')
     def job_list():
         """Show list of all jobs."""
-        # Sort jobs by creation date (newest first)
-        sorted_jobs = sorted(jobs.values(), key=lambda x: x['created_at'], reverse=True)
-        return render_template('job_list.html', jobs=sorted_jobs)
+        # The most recent jobs, sorted by creation date (newest first) by the store's index
+        sorted_jobs = jobs.list_jobs(limit=JOB_LIST_LIMIT)
+        status_counts = jobs.count_by_status()
+        return render_template(
+            'job_list.html',
+            jobs=sorted_jobs,
+            status_counts=status_counts,
+            total_jobs=sum(status_counts.values())
+        )
     
     @app.route('/download/<job_id>')
     def download_results(job_id):
         """Download results as JSON file."""
-        if job_id not in jobs:
+        job = jobs.get(job_id)
+        if job is None:
             flash('Job not found', 'error')
             return redirect(url_for('index'))
         
-        job = jobs[job_id]
-        
         if job['status'] != ProcessingStatus.COMPLETED:
             flash('Job not completed', 'error')
             return redirect(url_for('job_status', job_id=job_id))
@@ -291,8 +470,7 @@ def create_app():
         json_filename = f"results_{job_id[:8]}.json"
         json_path = os.path.join(app.config['OUTPUT_FOLDER'], json_filename)
         
-        with open(json_path, 'w') as f:
-            json.dump(result_data, f, indent=2, default=str)
+        _write_json_atomic(json_path, result_data)
         
         return send_file(json_path, as_attachment=True, download_name=json_filename)
     
@@ -309,11 +487,7 @@ def create_app():
         """
         try:
             # Find the job
-            job = None
-            for j in jobs.values():
-                if j['id'] == job_id:
-                    job = j
-                    break
+            job = jobs.get(job_id)
             
             if not job or not job.get('result') or not job['result'].design_criteria:
                 return jsonify({'error': 'Job not found or no results available'}), 404
@@ -350,26 +524,33 @@ def create_app():
             Image file
         """
         try:
-            image_path = os.path.join(app.config['EXTRACTED_IMAGES_FOLDER'], filename)
-            print(f"DEBUG: Trying to serve image: {image_path}")
-            print(f"DEBUG: File exists: {os.path.exists(image_path)}")
-            print(f"DEBUG: Is file: {os.path.isfile(image_path)}")
+            # Reject paths that would escape the images folder (e.g. "../")
+            image_path = safe_join(app.config['EXTRACTED_IMAGES_FOLDER'], filename)
+            if image_path is None:
+                return "Image not found", 404
             
-            if os.path.exists(image_path) and os.path.isfile(image_path):
-                # Check file size
-                file_size = os.path.getsize(image_path)
-                print(f"DEBUG: File size: {file_size} bytes")
-                
-                if file_size > 0:
-                    return send_file(image_path, mimetype='image/png')
-                else:
-                    print(f"DEBUG: File is empty")
-                    return "Image file is empty", 404
-            else:
-                print(f"DEBUG: File not found or not a file")
+            # One stat covers the existence, type and size checks
+            try:
+                stat_result = os.stat(image_path)
+            except OSError:
+                return "Image not found", 404
+            if not stat.S_ISREG(stat_result.st_mode):
                 return "Image not found", 404
+            if stat_result.st_size == 0:
+                return "Image file is empty", 404
+            
+            # Extracted images never change once written, so let browsers cache and revalidate them
+            mimetype = mimetypes.guess_type(image_path)[0] or 'image/png'
+            return send_file(
+                image_path,
+                mimetype=mimetype,
+                conditional=True,
+                etag=True,
+                last_modified=stat_result.st_mtime,
+                max_age=IMAGE_CACHE_MAX_AGE
+            )
         except Exception as e:
-            print(f"DEBUG: Error serving image: {str(e)}")
+            logger.error(f"Error serving image {filename}: {str(e)}")
             return f"Error serving image: {str(e)}", 500
     
     @app.route('/health')
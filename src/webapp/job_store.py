@@ -0,0 +1,178 @@
+"""
+SQLite-backed job store for the web application.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ..models.document_models import ProcessingStatus
+
+
+class JobStore:
+    """
+    Persist processing jobs in a SQLite database.
+    
+    Each thread gets its own connection and the database runs in WAL mode, so status
+    polls from request threads never block on the background jobs writing results.
+    Extraction results are stored pickled and only loaded when asked for.
+    """
+    
+    _COLUMNS = ('id', 'filename', 'file_path', 'status', 'created_at',
+                'started_at', 'completed_at', 'error_message')
+    _DATETIME_COLUMNS = ('created_at', 'started_at', 'completed_at')
+    
+    def __init__(self, db_path: str):
+        """
+        Open the job database, creating it if needed.
+        
+        Jobs left pending or processing by a previous run are marked as failed,
+        since the threads that owned them are gone.
+        
+        Args:
+            db_path: Path to the SQLite database file
+        """
+        self.db_path = db_path
+        self._local = threading.local()
+        
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    filename TEXT,
+                    file_path TEXT,
+                    status TEXT NOT NULL,
+                    created_at TEXT,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    error_message TEXT,
+                    result BLOB,
+                    created_at_ts REAL
+                )
+                """
+            )
+            # Databases created before created_at_ts existed get the column backfilled
+            if 'created_at_ts' not in {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}:
+                conn.execute("ALTER TABLE jobs ADD COLUMN created_at_ts REAL")
+                conn.execute("UPDATE jobs SET created_at_ts = (julianday(created_at) - 2440587.5) * 86400.0")
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_created_at_ts ON jobs (created_at_ts)")
+            conn.execute(
+                "UPDATE jobs SET status = ?, error_message = ?, completed_at = ? WHERE status IN (?, ?)",
+                (ProcessingStatus.FAILED.value, 'Interrupted by server restart', datetime.now().isoformat(),
+                 ProcessingStatus.PENDING.value, ProcessingStatus.PROCESSING.value)
+            )
+    
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection to the database."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    @classmethod
+    def _to_row(cls, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert job fields to column values."""
+        row = {}
+        for key, value in fields.items():
+            if key == 'result':
+                value = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL) if value is not None else None
+            elif key == 'status' and value is not None:
+                value = ProcessingStatus(value).value
+            elif key in cls._DATETIME_COLUMNS and value is not None:
+                value = value.isoformat()
+            elif key not in cls._COLUMNS:
+                raise KeyError(f"Unknown job field: {key}")
+            row[key] = value
+        return row
+    
+    @classmethod
+    def _from_row(cls, columns: tuple, row: tuple) -> Dict[str, Any]:
+        """Convert a database row to a job dictionary."""
+        job = dict(zip(columns, row))
+        job['status'] = ProcessingStatus(job['status'])
+        for key in cls._DATETIME_COLUMNS:
+            if job.get(key):
+                job[key] = datetime.fromisoformat(job[key])
+        if 'result' in job:
+            job['result'] = pickle.loads(job['result']) if job['result'] is not None else None
+        return job
+    
+    def create(self, job: Dict[str, Any]):
+        """
+        Add a new job.
+        
+        Args:
+            job: Job fields, including its 'id'
+        """
+        row = self._to_row(job)
+        # Creation time as an indexed epoch timestamp, for listing newest jobs first
+        row['created_at_ts'] = job['created_at'].timestamp() if job.get('created_at') else time.time()
+        columns = ', '.join(row)
+        placeholders = ', '.join('?' for _ in row)
+        with self._connection() as conn:
+            conn.execute(f"INSERT INTO jobs ({columns}) VALUES ({placeholders})", tuple(row.values()))
+    
+    def update(self, job_id: str, **fields):
+        """
+        Update fields of an existing job.
+        
+        Args:
+            job_id: Job identifier
+            **fields: Job fields to set
+        """
+        row = self._to_row(fields)
+        assignments = ', '.join(f"{column} = ?" for column in row)
+        with self._connection() as conn:
+            conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*row.values(), job_id))
+    
+    def get(self, job_id: str, include_result: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Get a job by id.
+        
+        Args:
+            job_id: Job identifier
+            include_result: Whether to load the stored extraction result
+        
+        Returns:
+            Job dictionary, or None if there is no such job
+        """
+        columns = self._COLUMNS + ('result',) if include_result else self._COLUMNS
+        row = self._connection().execute(
+            f"SELECT {', '.join(columns)} FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return self._from_row(columns, row) if row is not None else None
+    
+    def list_jobs(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        List jobs without their results, newest first.
+        
+        Args:
+            limit: Maximum number of jobs to return, or None for all
+            
+        Returns:
+            List of job dictionaries
+        """
+        rows = self._connection().execute(
+            f"SELECT {', '.join(self._COLUMNS)} FROM jobs ORDER BY created_at_ts DESC LIMIT ?",
+            (limit if limit is not None else -1,)
+        ).fetchall()
+        return [self._from_row(self._COLUMNS, row) for row in rows]
+    
+    def count_by_status(self) -> Dict[str, int]:
+        """
+        Count jobs in each status.
+        
+        Returns:
+            Dictionary of status value to job count
+        """
+        return dict(self._connection().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
@@ -5,6 +5,7 @@ Flask web application runner for Engineering Design Criteria Extractor.
 
 import os
 import sys
+import multiprocessing
 from pathlib import Path
 
 # Add the src directory to the Python path
@@ -21,7 +22,38 @@ except Exception:
 
 from src.webapp.app import create_app
 
+# gunicorn is optional and POSIX-only; the Windows build uses Flask's threaded server
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:
+    BaseApplication = None
+
+
+def run_gunicorn(app, host: str, port: int, threads: int):
+    """Serve the app with gunicorn's gthread worker in this process.
+
+    A single worker process keeps the in-process job executor and status cache
+    shared by all requests; its threads serve uploads, status polls and images
+    concurrently, and static files go out through the worker's sendfile support.
+    """
+    class _Application(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("workers", 1)
+            self.cfg.set("threads", threads)
+            # Uploads of up to 50MB can take a while on slow links
+            self.cfg.set("timeout", 300)
+
+        def load(self):
+            return app
+
+    _Application().run()
+
 if __name__ == "__main__":
+    # Required for worker processes (PDF image extraction) in the frozen Windows build
+    multiprocessing.freeze_support()
+    
     app = create_app()
     
     # Get configuration from environment
@@ -36,10 +68,23 @@ if __name__ == "__main__":
     print(f"📁 Output folder: {app.config['OUTPUT_FOLDER']}")
     print("=" * 60)
     
+    # WEB_SERVER=gunicorn selects gunicorn when it is installed
+    use_gunicorn = os.getenv("WEB_SERVER", "flask").lower() == "gunicorn" and not debug
+    if use_gunicorn and BaseApplication is None:
+        print("⚠️  gunicorn is not installed; falling back to the Flask server")
+        use_gunicorn = False
+    
     try:
-        app.run(host=host, port=port, debug=debug)
+        if use_gunicorn:
+            threads = int(os.getenv("WEB_THREADS") or (os.cpu_count() or 1) * 2 + 1)
+            print(f"🧵 Serving with gunicorn (gthread, {threads} threads)")
+            run_gunicorn(app, host, port, threads)
+        else:
+            app.run(host=host, port=port, debug=debug, threaded=True)
     except KeyboardInterrupt:
         print("\n👋 Shutting down gracefully...")
     except Exception as e:
         print(f"❌ Error starting server: {e}")
-        sys.exit(1) 
\ No newline at end of file
+        sys.exit(1)
+    finally:
+        app.extensions['shutdown_workers']() 
\ No newline at end of file
@@ -3,8 +3,6 @@ Tests for the Engineering Design Criteria Extractor.
 """
 
 import pytest
-import os
-import tempfile
 from unittest.mock import Mock, patch
 from pathlib import Path
 
@@ -17,6 +15,29 @@ from models.schemas import DesignCriteria, LoadSpecification, LoadType
 from models.document_models import ProcessingStatus
 
 
+@pytest.fixture(scope="session")
+def pdf_dir(tmp_path_factory):
+    """Directory of fake PDF files, written once per test session."""
+    directory = tmp_path_factory.mktemp("pdfs")
+    for i in range(3):
+        (directory / f"test_{i}.pdf").write_bytes(b"%PDF-1.4\n%Test PDF content")
+    return directory
+
+
+@pytest.fixture(scope="session")
+def fake_pdf(pdf_dir):
+    """Path to a fake PDF file."""
+    return str(pdf_dir / "test_0.pdf")
+
+
+@pytest.fixture(scope="session")
+def fake_txt(tmp_path_factory):
+    """Path to a non-PDF file."""
+    path = tmp_path_factory.mktemp("txt") / "test.txt"
+    path.write_bytes(b"Not a PDF file")
+    return str(path)
+
+
 class TestEngineeringCriteriaExtractor:
     """Test cases for EngineeringCriteriaExtractor."""
     
@@ -43,38 +64,28 @@ class TestEngineeringCriteriaExtractor:
         assert extractor.processor_id == "test-processor"
         assert extractor.location == "us"
     
-    def test_extract_from_file_success(self, extractor, mock_processor):
+    def test_extract_from_file_success(self, extractor, mock_processor, fake_pdf):
         """Test successful file extraction."""
-        # Create a temporary PDF file
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-            temp_file.write(b"%PDF-1.4\n%Test PDF content")
-            temp_file_path = temp_file.name
+        # Mock the extraction result
+        mock_criteria = DesignCriteria(
+            loads=[],
+            seismic_forces=[],
+            design_vehicles=[],
+            design_cranes=[],
+            tables=[],
+            images=[],
+            metadata=Mock(filename="test.pdf", file_size=100, page_count=1),
+            confidence_score=0.95
+        )
         
-        try:
-            # Mock the extraction result
-            mock_criteria = DesignCriteria(
-                loads=[],
-                seismic_forces=[],
-                design_vehicles=[],
-                design_cranes=[],
-                tables=[],
-                images=[],
-                metadata=Mock(filename="test.pdf", file_size=100, page_count=1),
-                confidence_score=0.95
-            )
-            
-            mock_processor.extract_engineering_criteria.return_value = mock_criteria
-            
-            # Test extraction
-            result = extractor.extract_from_file(temp_file_path)
-            
-            assert result.status == ProcessingStatus.COMPLETED
-            assert result.design_criteria == mock_criteria
-            assert result.error_message is None
-            
-        finally:
-            # Clean up
-            os.unlink(temp_file_path)
+        mock_processor.extract_engineering_criteria.return_value = mock_criteria
+        
+        # Test extraction
+        result = extractor.extract_from_file(fake_pdf)
+        
+        assert result.status == ProcessingStatus.COMPLETED
+        assert result.design_criteria == mock_criteria
+        assert result.error_message is None
     
     def test_extract_from_file_not_found(self, extractor):
         """Test extraction with non-existent file."""
@@ -83,53 +94,40 @@ class TestEngineeringCriteriaExtractor:
         assert result.status == ProcessingStatus.FAILED
         assert "File not found" in result.error_message
     
-    def test_extract_from_file_not_pdf(self, extractor):
+    def test_extract_from_file_not_pdf(self, extractor, fake_txt):
         """Test extraction with non-PDF file."""
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as temp_file:
-            temp_file.write(b"Not a PDF file")
-            temp_file_path = temp_file.name
+        result = extractor.extract_from_file(fake_txt)
         
-        try:
-            result = extractor.extract_from_file(temp_file_path)
-            
-            assert result.status == ProcessingStatus.FAILED
-            assert "must be a PDF" in result.error_message
-            
-        finally:
-            os.unlink(temp_file_path)
+        assert result.status == ProcessingStatus.FAILED
+        assert "must be a PDF" in result.error_message
     
-    def test_extract_from_directory(self, extractor, mock_processor):
+    def test_extract_from_directory(self, extractor, mock_processor, pdf_dir):
         """Test directory extraction."""
-        # Create temporary directory with PDF files
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create test PDF files
-            pdf_files = []
-            for i in range(3):
-                pdf_path = os.path.join(temp_dir, f"test_{i}.pdf")
-                with open(pdf_path, 'wb') as f:
-                    f.write(b"%PDF-1.4\n%Test PDF content")
-                pdf_files.append(pdf_path)
-            
-            # Mock the extraction result
-            mock_criteria = DesignCriteria(
-                loads=[],
-                seismic_forces=[],
-                design_vehicles=[],
-                design_cranes=[],
-                tables=[],
-                images=[],
-                metadata=Mock(filename="test.pdf", file_size=100, page_count=1),
-                confidence_score=0.95
-            )
-            
-            mock_processor.extract_engineering_criteria.return_value = mock_criteria
-            
-            # Test extraction
-            results = extractor.extract_from_directory(temp_dir, "data/output")
-            
-            assert len(results) == 3
-            for result in results.values():
-                assert result.status == ProcessingStatus.COMPLETED
+        # Mock the extraction result
+        mock_criteria = DesignCriteria(
+            loads=[],
+            seismic_forces=[],
+            design_vehicles=[],
+            design_cranes=[],
+            tables=[],
+            images=[],
+            metadata=Mock(filename="test.pdf", file_size=100, page_count=1),
+            confidence_score=0.95
+        )
+        
+        mock_processor.extract_engineering_criteria.return_value = mock_criteria
+        
+        # Test extraction
+        results = extractor.extract_from_directory(str(pdf_dir), "data/output")
+        
+        assert len(results) == 3
+        for result in results.values():
+            assert result.status == ProcessingStatus.COMPLETED
+    
+    def test_extract_from_directory_invalid_workers(self, extractor, pdf_dir):
+        """Test directory extraction rejects a worker count below 1."""
+        with pytest.raises(ValueError):
+            extractor.extract_from_directory(str(pdf_dir), "data/output", max_workers=0)
     
     def test_get_processor_info(self, extractor, mock_processor):
         """Test getting processor information."""
@@ -0,0 +1,81 @@
+"""
+Tests for reading image metadata from Document AI JSON responses.
+"""
+
+import json
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add the repository root to path so the package's relative imports resolve
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processors import image_extractor
+from src.processors.image_extractor import ImageExtractor
+
+
+def image_entry(x1, y1, x2, y2, confidence, mime_type="image/png"):
+    """Document AI page image with a rectangular bounding box."""
+    return {
+        'layout': {
+            'confidence': confidence,
+            'bounding_poly': {
+                'vertices': [
+                    {'x': x1, 'y': y1},
+                    {'x': x2, 'y': y1},
+                    {'x': x2, 'y': y2},
+                    {'x': x1, 'y': y2}
+                ]
+            }
+        },
+        'mime_type': mime_type,
+        'content': "iVBORw0KGgo="
+    }
+
+
+@pytest.fixture
+def document_path(tmp_path):
+    """Small Document AI response with images on some of its pages."""
+    response = {
+        'text': "DESIGN CRITERIA",
+        'pages': [
+            {
+                'page_number': 1,
+                'image': [image_entry(10, 20, 110, 220, 0.9), image_entry(5, 5, 50, 40, 0.75, "image/jpeg")],
+                'tokens': [{'layout': {'confidence': 0.5}}]
+            },
+            {'page_number': 2, 'image': []},
+            {'page_number': 3, 'image': [image_entry(0.1, 0.2, 0.6, 0.8, 1.0)]}
+        ]
+    }
+    path = tmp_path / "response.json"
+    path.write_text(json.dumps(response))
+    return str(path)
+
+
+class TestImageMetadata:
+    """Test cases for ImageExtractor.get_image_metadata."""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Extractor without the Document AI Toolbox check, which these methods do not need."""
+        return ImageExtractor.__new__(ImageExtractor)
+    
+    @pytest.mark.skipif(image_extractor.ijson is None, reason="ijson is not installed")
+    def test_streamed_metadata_matches_loaded_document(self, extractor, document_path):
+        """Test streaming the JSON file gives the same metadata as reading the loaded document."""
+        with open(document_path) as f:
+            wrapped_document = json.load(f, object_hook=lambda fields: SimpleNamespace(**fields))
+        
+        loaded = extractor.get_image_metadata(document_path, wrapped_document=wrapped_document)
+        streamed = extractor._stream_image_metadata(document_path)
+        
+        assert len(streamed) == 3
+        assert streamed == loaded
+        assert [(image['page_number'], image['image_index']) for image in streamed] == [(1, 0), (1, 1), (3, 0)]
+        assert streamed[0]['bounding_box'] == {'x': 10, 'y': 20, 'width': 100, 'height': 200}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,176 @@
+"""
+Tests for the SQLite-backed web application job store.
+"""
+
+import sqlite3
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add the repository root to path so the package's relative imports resolve
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.webapp.job_store import JobStore
+from src.models.document_models import ProcessingStatus
+
+
+def make_job(job_id, created_at=None, status=ProcessingStatus.PENDING):
+    """Job fields as created by the upload handler."""
+    return {
+        'id': job_id,
+        'filename': f"{job_id}.pdf",
+        'file_path': f"data/uploads/{job_id}.pdf",
+        'status': status,
+        'created_at': created_at or datetime(2024, 1, 1, 12, 0, 0),
+        'result': None,
+        'error_message': None
+    }
+
+
+class TestJobStore:
+    """Test cases for JobStore."""
+    
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Path to a fresh job database."""
+        return str(tmp_path / "jobs.db")
+    
+    @pytest.fixture
+    def store(self, db_path):
+        """Create an empty job store."""
+        return JobStore(db_path)
+    
+    def test_create_and_get(self, store):
+        """Test a created job is returned with its fields converted back."""
+        job = make_job("job-1")
+        store.create(job)
+        
+        stored = store.get("job-1")
+        
+        assert stored['id'] == "job-1"
+        assert stored['filename'] == "job-1.pdf"
+        assert stored['status'] == ProcessingStatus.PENDING
+        assert stored['created_at'] == job['created_at']
+        assert stored['started_at'] is None
+        assert stored['result'] is None
+    
+    def test_get_missing_job(self, store):
+        """Test getting an unknown job id."""
+        assert store.get("missing") is None
+    
+    def test_update(self, store):
+        """Test updating status, timestamps and the result."""
+        store.create(make_job("job-1"))
+        completed_at = datetime(2024, 1, 1, 12, 5, 0)
+        result = {'status': 'completed', 'images': ["a.png", "b.png"]}
+        
+        store.update("job-1", status=ProcessingStatus.COMPLETED, completed_at=completed_at, result=result)
+        stored = store.get("job-1")
+        
+        assert stored['status'] == ProcessingStatus.COMPLETED
+        assert stored['completed_at'] == completed_at
+        assert stored['result'] == result
+    
+    def test_update_unknown_field(self, store):
+        """Test updating a field that is not a job column."""
+        store.create(make_job("job-1"))
+        
+        with pytest.raises(KeyError):
+            store.update("job-1", unknown="value")
+    
+    def test_get_without_result(self, store):
+        """Test the stored result is only loaded when asked for."""
+        store.create(make_job("job-1"))
+        store.update("job-1", result={'loads': []})
+        
+        assert 'result' not in store.get("job-1", include_result=False)
+        assert store.get("job-1", include_result=True)['result'] == {'loads': []}
+    
+    def test_list_jobs_newest_first(self, store):
+        """Test jobs are listed newest first, without results."""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        for i in (1, 0, 2):
+            store.create(make_job(f"job-{i}", created_at=start + timedelta(minutes=i)))
+        
+        jobs = store.list_jobs()
+        
+        assert [job['id'] for job in jobs] == ["job-2", "job-1", "job-0"]
+        assert all('result' not in job for job in jobs)
+    
+    def test_list_jobs_limit(self, store):
+        """Test listing only the newest jobs."""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        for i in range(5):
+            store.create(make_job(f"job-{i}", created_at=start + timedelta(minutes=i)))
+        
+        assert [job['id'] for job in store.list_jobs(limit=2)] == ["job-4", "job-3"]
+        assert len(store.list_jobs(limit=None)) == 5
+    
+    def test_count_by_status(self, store):
+        """Test counting jobs in each status."""
+        store.create(make_job("job-1"))
+        store.create(make_job("job-2", status=ProcessingStatus.COMPLETED))
+        store.create(make_job("job-3", status=ProcessingStatus.COMPLETED))
+        store.create(make_job("job-4", status=ProcessingStatus.FAILED))
+        
+        counts = store.count_by_status()
+        
+        assert counts == {
+            ProcessingStatus.PENDING.value: 1,
+            ProcessingStatus.COMPLETED.value: 2,
+            ProcessingStatus.FAILED.value: 1
+        }
+    
+    def test_restart_marks_unfinished_jobs_failed(self, db_path, store):
+        """Test jobs left pending or processing are failed when the store is reopened."""
+        store.create(make_job("pending"))
+        store.create(make_job("processing", status=ProcessingStatus.PROCESSING))
+        store.create(make_job("completed", status=ProcessingStatus.COMPLETED))
+        
+        reopened = JobStore(db_path)
+        
+        for job_id in ("pending", "processing"):
+            job = reopened.get(job_id)
+            assert job['status'] == ProcessingStatus.FAILED
+            assert job['error_message'] == "Interrupted by server restart"
+            assert job['completed_at'] is not None
+        assert reopened.get("completed")['status'] == ProcessingStatus.COMPLETED
+        assert reopened.get("completed")['error_message'] is None
+    
+    def test_migration_adds_created_at_ts(self, db_path):
+        """Test a database from before created_at_ts gets the column backfilled."""
+        conn = sqlite3.connect(db_path)
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE jobs (
+                    id TEXT PRIMARY KEY,
+                    filename TEXT,
+                    file_path TEXT,
+                    status TEXT NOT NULL,
+                    created_at TEXT,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    error_message TEXT,
+                    result BLOB
+                )
+                """
+            )
+            for job_id, created_at in (("old", "2024-01-01T12:00:00"), ("new", "2024-01-02T12:00:00")):
+                conn.execute(
+                    "INSERT INTO jobs (id, status, created_at) VALUES (?, ?, ?)",
+                    (job_id, ProcessingStatus.COMPLETED.value, created_at)
+                )
+        conn.close()
+        
+        store = JobStore(db_path)
+        
+        columns = {row[1] for row in sqlite3.connect(db_path).execute("PRAGMA table_info(jobs)")}
+        assert 'created_at_ts' in columns
+        assert [job['id'] for job in store.list_jobs()] == ["new", "old"]
+        assert store.get("old")['created_at'] == datetime(2024, 1, 1, 12, 0, 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])